@@ -1,13 +1,76 @@
-from nicegui import ui, events, app
-from datetime import datetime
-from typing import List
+from nicegui import ui, events, app, run
+from datetime import date, datetime, time
+from io import BytesIO
+from typing import Any, Callable, Dict, List, Optional
 import logging
+import os
+import uuid
 
 from app.complaint_service import ComplaintService
 from app.models import ComplaintCreate, ComplaintCategory, ComplaintUrgency
 
 logger = logging.getLogger(__name__)
 
+# Select options are constant, so build them once per process rather than on every page render
+_CATEGORY_OPTIONS = {
+    ComplaintCategory.EXCESSIVE_FORCE.value: "Excessive Force",
+    ComplaintCategory.MISCONDUCT.value: "Professional Misconduct",
+    ComplaintCategory.DISCRIMINATION.value: "Discrimination",
+    ComplaintCategory.CORRUPTION.value: "Corruption",
+    ComplaintCategory.HARASSMENT.value: "Harassment",
+    ComplaintCategory.ABUSE_OF_POWER.value: "Abuse of Power",
+    ComplaintCategory.OTHER.value: "Other",
+}
+
+_URGENCY_OPTIONS = {
+    ComplaintUrgency.LOW.value: "Low - General concern",
+    ComplaintUrgency.MEDIUM.value: "Medium - Significant issue",
+    ComplaintUrgency.HIGH.value: "High - Serious misconduct",
+    ComplaintUrgency.CRITICAL.value: "Critical - Emergency response needed",
+}
+
+_VALUE_TO_CATEGORY = {category.value: category for category in ComplaintCategory}
+_VALUE_TO_URGENCY = {urgency.value: urgency for urgency in ComplaintUrgency}
+
+# Button styles shared across the landing, submission and success pages
+_HOME_PRIMARY_BUTTON = (
+    "w-full bg-blue-600 hover:bg-blue-700 text-white py-4 px-6 rounded-lg "
+    "text-lg font-medium shadow-lg transition-colors"
+)
+_HOME_SECONDARY_BUTTON = (
+    "w-full bg-gray-600 hover:bg-gray-700 text-white py-4 px-6 rounded-lg "
+    "text-lg font-medium shadow-lg transition-colors"
+)
+_SUBMIT_BUTTON = (
+    "w-full bg-blue-600 hover:bg-blue-700 text-white py-3 px-6 rounded-lg "
+    "text-lg font-medium shadow-lg transition-colors mt-6"
+)
+_ACTION_PRIMARY_BUTTON = "w-full bg-blue-600 hover:bg-blue-700 text-white py-3 px-6 rounded-lg"
+_ACTION_SECONDARY_BUTTON = "w-full bg-gray-600 hover:bg-gray-700 text-white py-3 px-6 rounded-lg"
+_ACTION_MUTED_BUTTON = "w-full bg-gray-400 hover:bg-gray-500 text-white py-3 px-6 rounded-lg"
+
+
+def _lazy_expansion(text: str, build: Callable[[], None]) -> ui.expansion:
+    """Expansion whose content is built the first time it is opened"""
+    built = False
+
+    def on_open(e: events.ValueChangeEventArguments) -> None:
+        nonlocal built
+        if e.value and not built:
+            built = True
+            with expansion:
+                build()
+
+    expansion = ui.expansion(text, on_value_change=on_open).classes("w-full mt-6")
+    return expansion
+
+
+def _optional_text(element: Optional[ui.input]) -> Optional[str]:
+    """Stripped value of an optional text input, or None if it was never built or left empty"""
+    if element is None or not element.value:
+        return None
+    return element.value.strip()
+
 
 def create():
     """Create complaint submission module"""
@@ -64,13 +127,11 @@ def create():
             # Action buttons
             with ui.column().classes("gap-3 w-full"):
                 ui.button("Submit New Complaint", on_click=lambda: ui.navigate.to("/submit")).classes(
-                    "w-full bg-blue-600 hover:bg-blue-700 text-white py-4 px-6 rounded-lg "
-                    "text-lg font-medium shadow-lg transition-colors"
+                    _HOME_PRIMARY_BUTTON
                 )
 
                 ui.button("Track Existing Complaint", on_click=lambda: ui.navigate.to("/track")).classes(
-                    "w-full bg-gray-600 hover:bg-gray-700 text-white py-4 px-6 rounded-lg "
-                    "text-lg font-medium shadow-lg transition-colors"
+                    _HOME_SECONDARY_BUTTON
                 )
 
             # Footer information
@@ -103,32 +164,19 @@ def create():
                 title_input = ui.input(label="Complaint Title", placeholder="Brief description of the issue").classes(
                     "w-full mb-4"
                 )
-                title_input.props('counter maxlength="200"')
+                title_input.props('counter maxlength="200" debounce="300"')
 
                 # Category selection
                 category_select = ui.select(
                     label="Category",
-                    options={
-                        ComplaintCategory.EXCESSIVE_FORCE.value: "Excessive Force",
-                        ComplaintCategory.MISCONDUCT.value: "Professional Misconduct",
-                        ComplaintCategory.DISCRIMINATION.value: "Discrimination",
-                        ComplaintCategory.CORRUPTION.value: "Corruption",
-                        ComplaintCategory.HARASSMENT.value: "Harassment",
-                        ComplaintCategory.ABUSE_OF_POWER.value: "Abuse of Power",
-                        ComplaintCategory.OTHER.value: "Other",
-                    },
+                    options=_CATEGORY_OPTIONS,
                     value=ComplaintCategory.OTHER.value,
                 ).classes("w-full mb-4")
 
                 # Urgency selection
                 urgency_select = ui.select(
                     label="Urgency Level",
-                    options={
-                        ComplaintUrgency.LOW.value: "Low - General concern",
-                        ComplaintUrgency.MEDIUM.value: "Medium - Significant issue",
-                        ComplaintUrgency.HIGH.value: "High - Serious misconduct",
-                        ComplaintUrgency.CRITICAL.value: "Critical - Emergency response needed",
-                    },
+                    options=_URGENCY_OPTIONS,
                     value=ComplaintUrgency.MEDIUM.value,
                 ).classes("w-full mb-4")
 
@@ -136,34 +184,49 @@ def create():
                 description_input = ui.textarea(
                     label="Detailed Description", placeholder="Please provide a detailed description of the incident..."
                 ).classes("w-full mb-4")
-                description_input.props('rows="5" counter maxlength="5000"')
-
-                # Optional incident details
-                ui.label("Incident Details (Optional)").classes("text-sm font-medium text-gray-700 mt-6 mb-2")
-
-                with ui.row().classes("w-full gap-4"):
-                    incident_date = ui.date("Incident Date").classes("flex-1")
-                    incident_time = ui.time("Incident Time").classes("flex-1")
-
-                location_input = ui.input(
-                    label="Location of Incident", placeholder="Address, intersection, or general area"
-                ).classes("w-full mb-4")
-
-                with ui.row().classes("w-full gap-4"):
-                    officer_name = ui.input(label="Officer Name (if known)", placeholder="Officer's name").classes(
-                        "flex-1"
+                # Debounce client-to-server value sync instead of sending an event per keystroke
+                description_input.props('rows="5" counter maxlength="5000" debounce="300"')
+
+                # Optional sections are built the first time they are opened to keep the initial page small
+                incident_fields: Dict[str, Any] = {}
+                contact_fields: Dict[str, Any] = {}
+
+                def build_incident_details():
+                    with ui.row().classes("w-full gap-4"):
+                        with ui.column().classes("flex-1"):
+                            ui.label("Incident Date").classes("text-sm text-gray-700")
+                            incident_fields["date"] = ui.date()
+                        with ui.column().classes("flex-1"):
+                            ui.label("Incident Time").classes("text-sm text-gray-700")
+                            incident_fields["time"] = ui.time()
+
+                    incident_fields["location"] = ui.input(
+                        label="Location of Incident", placeholder="Address, intersection, or general area"
+                    ).classes("w-full mb-4")
+
+                    with ui.row().classes("w-full gap-4"):
+                        incident_fields["officer_name"] = ui.input(
+                            label="Officer Name (if known)", placeholder="Officer's name"
+                        ).classes("flex-1")
+                        incident_fields["badge_number"] = ui.input(
+                            label="Badge Number (if visible)", placeholder="Badge #"
+                        ).classes("flex-1")
+
+                def build_contact_information():
+                    ui.label("Providing contact information allows follow-up but is completely optional").classes(
+                        "text-xs text-gray-500 mb-3"
                     )
-                    badge_number = ui.input(label="Badge Number (if visible)", placeholder="Badge #").classes("flex-1")
 
-                # Optional contact information
-                ui.label("Contact Information (Optional)").classes("text-sm font-medium text-gray-700 mt-6 mb-2")
-                ui.label("Providing contact information allows follow-up but is completely optional").classes(
-                    "text-xs text-gray-500 mb-3"
-                )
+                    with ui.row().classes("w-full gap-4"):
+                        contact_fields["email"] = ui.input(label="Email Address", placeholder="your@email.com").classes(
+                            "flex-1"
+                        )
+                        contact_fields["phone"] = ui.input(label="Phone Number", placeholder="(555) 123-4567").classes(
+                            "flex-1"
+                        )
 
-                with ui.row().classes("w-full gap-4"):
-                    contact_email = ui.input(label="Email Address", placeholder="your@email.com").classes("flex-1")
-                    contact_phone = ui.input(label="Phone Number", placeholder="(555) 123-4567").classes("flex-1")
+                _lazy_expansion("Incident Details (Optional)", build_incident_details)
+                _lazy_expansion("Contact Information (Optional)", build_contact_information)
 
                 # File upload section
                 ui.label("Media Attachments (Optional)").classes("text-sm font-medium text-gray-700 mt-6 mb-2")
@@ -171,7 +234,10 @@ def create():
                     "text-xs text-gray-500 mb-3"
                 )
 
+                # Uploads are spooled to disk on arrival; only their metadata is kept in memory
                 uploaded_files: List[dict] = []
+                staging_key = uuid.uuid4().hex
+                ui.context.client.on_disconnect(lambda: service.discard_staged_uploads(staging_key))
 
                 @ui.refreshable
                 def show_uploaded_files():
@@ -186,36 +252,38 @@ def create():
                                     "text-sm text-gray-700"
                                 )
 
-                def handle_upload(e: events.UploadEventArguments):
+                async def handle_upload(e: events.UploadEventArguments):
                     if not e.content:
                         ui.notify("Empty file uploaded", type="negative")
                         return
 
-                    # Handle both bytes and file-like objects
                     try:
-                        if hasattr(e.content, "read"):
-                            content_bytes = e.content.read()
-                            e.content.seek(0)  # Reset for later use
-                        else:
-                            content_bytes = e.content
-
-                        if not isinstance(content_bytes, bytes):
-                            ui.notify("Invalid file content", type="negative")
-                            return
-
-                        file_size_mb = len(content_bytes) / (1024 * 1024)
+                        content = BytesIO(e.content) if isinstance(e.content, bytes) else e.content
+                        file_size = content.seek(0, os.SEEK_END)
+                        content.seek(0)
+                        file_size_mb = file_size / (1024 * 1024)
                     except Exception as ex:
                         logger.error(f"Error processing uploaded file: {str(ex)}")
                         ui.notify("Error processing file", type="negative")
                         return
+                    if file_size == 0:
+                        ui.notify("Empty file uploaded", type="negative")
+                        return
                     if file_size_mb > 50:
                         ui.notify(f"File too large: {file_size_mb:.1f}MB (max 50MB)", type="negative")
                         return
 
+                    try:
+                        staged = await run.io_bound(service.stage_upload, staging_key, content)
+                    except Exception as ex:
+                        logger.error(f"Error staging uploaded file: {str(ex)}")
+                        ui.notify("Error processing file", type="negative")
+                        return
+
                     uploaded_files.append(
                         {
                             "name": e.name,
-                            "content": content_bytes,  # Use the processed bytes
+                            "staged": staged,
                             "type": e.type,
                             "size_mb": file_size_mb,
                         }
@@ -244,46 +312,52 @@ def create():
                     try:
                         # Prepare complaint data
                         incident_datetime = None
-                        if incident_date.value:
-                            # Parse date and add time if provided
-                            incident_dt = datetime.fromisoformat(incident_date.value)
-                            if incident_time.value:
-                                time_parts = incident_time.value.split(":")
-                                incident_dt = incident_dt.replace(hour=int(time_parts[0]), minute=int(time_parts[1]))
-                            incident_datetime = incident_dt
+                        incident_date = incident_fields.get("date")
+                        incident_time = incident_fields.get("time")
+                        if incident_date and incident_date.value:
+                            # Combine date with time if provided (midnight otherwise)
+                            incident_datetime = datetime.combine(
+                                date.fromisoformat(incident_date.value),
+                                time.fromisoformat(incident_time.value)
+                                if incident_time and incident_time.value
+                                else time(0),
+                            )
 
                         complaint_data = ComplaintCreate(
                             title=title_input.value.strip(),
                             description=description_input.value.strip(),
-                            category=ComplaintCategory(category_select.value),
-                            urgency=ComplaintUrgency(urgency_select.value),
+                            # Both selects start with a value and offer no empty option
+                            category=_VALUE_TO_CATEGORY[str(category_select.value)],
+                            urgency=_VALUE_TO_URGENCY[str(urgency_select.value)],
                             incident_date=incident_datetime,
-                            incident_location=location_input.value.strip() if location_input.value else None,
-                            officer_name=officer_name.value.strip() if officer_name.value else None,
-                            officer_badge_number=badge_number.value.strip() if badge_number.value else None,
-                            contact_email=contact_email.value.strip() if contact_email.value else None,
-                            contact_phone=contact_phone.value.strip() if contact_phone.value else None,
+                            incident_location=_optional_text(incident_fields.get("location")),
+                            officer_name=_optional_text(incident_fields.get("officer_name")),
+                            officer_badge_number=_optional_text(incident_fields.get("badge_number")),
+                            contact_email=_optional_text(contact_fields.get("email")),
+                            contact_phone=_optional_text(contact_fields.get("phone")),
                         )
 
                         # Get client IP (basic tracking) - simplified for now
                         client_ip = None
 
-                        # Create complaint
-                        complaint, tracking_id = service.create_complaint(complaint_data, client_ip)
+                        # Create complaint (database commit runs off the event loop)
+                        complaint, tracking_id = await run.io_bound(service.create_complaint, complaint_data, client_ip)
 
                         if not complaint or not complaint.id:
                             ui.notify("Failed to create complaint", type="negative")
                             return
 
-                        # Upload files if any
-                        for file_info in uploaded_files:
+                        # Attach files if any - one transaction, run off the event loop
+                        if uploaded_files:
+                            files = [(info["name"], info["staged"], info["type"]) for info in uploaded_files]
                             try:
-                                service.add_media_attachment(
-                                    complaint.id, file_info["name"], file_info["content"], file_info["type"]
-                                )
+                                attachments = await run.io_bound(service.add_media_attachments, complaint.id, files)
                             except Exception as e:
-                                logger.error(f"Failed to upload file {file_info['name']}: {str(e)}")
-                                ui.notify(f"Warning: Failed to upload {file_info['name']}", type="warning")
+                                logger.error(f"Failed to upload attachments: {str(e)}")
+                                attachments = [None] * len(uploaded_files)
+                            for file_info, attachment in zip(uploaded_files, attachments):
+                                if attachment is None:
+                                    ui.notify(f"Warning: Failed to upload {file_info['name']}", type="warning")
 
                         # Store tracking ID for display
                         app.storage.tab["submitted_tracking_id"] = tracking_id
@@ -298,10 +372,7 @@ def create():
                         )
 
                 # Submit button
-                ui.button("Submit Complaint", on_click=submit_complaint).classes(
-                    "w-full bg-blue-600 hover:bg-blue-700 text-white py-3 px-6 rounded-lg "
-                    "text-lg font-medium shadow-lg transition-colors mt-6"
-                )
+                ui.button("Submit Complaint", on_click=submit_complaint).classes(_SUBMIT_BUTTON)
 
                 # Disclaimer
                 with ui.card().classes("p-4 bg-yellow-50 border-l-4 border-yellow-400 mt-6"):
@@ -346,13 +417,11 @@ def create():
             # Action buttons
             with ui.column().classes("gap-3 w-full mt-6"):
                 ui.button("Track This Complaint", on_click=lambda: ui.navigate.to("/track")).classes(
-                    "w-full bg-blue-600 hover:bg-blue-700 text-white py-3 px-6 rounded-lg"
+                    _ACTION_PRIMARY_BUTTON
                 )
 
                 ui.button("Submit Another Complaint", on_click=lambda: ui.navigate.to("/submit")).classes(
-                    "w-full bg-gray-600 hover:bg-gray-700 text-white py-3 px-6 rounded-lg"
+                    _ACTION_SECONDARY_BUTTON
                 )
 
-                ui.button("Return to Home", on_click=lambda: ui.navigate.to("/")).classes(
-                    "w-full bg-gray-400 hover:bg-gray-500 text-white py-3 px-6 rounded-lg"
-                )
+                ui.button("Return to Home", on_click=lambda: ui.navigate.to("/")).classes(_ACTION_MUTED_BUTTON)
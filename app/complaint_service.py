@@ -1,9 +1,20 @@
 import hashlib
+import io
+import logging
+import os
+import secrets
+import shutil
+import threading
+import time
 import uuid
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List
-from sqlmodel import select
+from typing import Any, BinaryIO, Callable, Dict, Hashable, NamedTuple, Optional, List, Sequence, Tuple, TypeVar
+from psycopg2.errors import UniqueViolation
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import Column, Index, UniqueConstraint, bindparam, inspect, literal, tuple_
+from sqlmodel import col, select, func
+from sqlmodel.sql.expression import Select
 
 from app.database import get_session
 from app.models import (
@@ -14,14 +25,112 @@ from app.models import (
     MediaType,
     ComplaintCategory,
     ComplaintStatus,
+    ComplaintUrgency,
 )
 
+# Row of the columns exposed by ComplaintPublic, in field order
+_PublicRow = Tuple[str, str, ComplaintCategory, ComplaintStatus, datetime, datetime]
+
+# Selecting these columns directly skips loading the large fields and ORM identity tracking.
+# sqlmodel's select() is only typed for up to four columns, so the statement is built from its Select class.
+_SELECT_PUBLIC: Select[_PublicRow] = Select(
+    col(Complaint.tracking_id),
+    col(Complaint.title),
+    col(Complaint.category),
+    col(Complaint.status),
+    col(Complaint.created_at),
+    col(Complaint.updated_at),
+)
+
+# Built once so every lookup reuses the same statement (and SQLAlchemy's compiled form); the ID is bound per call
+_TRACKING_ID_LOOKUP = _SELECT_PUBLIC.where(col(Complaint.tracking_id) == bindparam("tracking_id"))
+
+
+def _public_from_row(row: _PublicRow) -> ComplaintPublic:
+    """ComplaintPublic from a row of _SELECT_PUBLIC, without re-validating values the database already typed"""
+    tracking_id, title, category, status, created_at, updated_at = row
+    return ComplaintPublic.model_construct(
+        tracking_id=tracking_id,
+        title=title,
+        category=category,
+        status=status,
+        created_at=created_at,
+        updated_at=updated_at,
+    )
+
+
+def _unique_index_name(column: Column) -> str:
+    """Name of the unique index or constraint on just this column, as the database reports it on violations"""
+    for constraint in [*column.table.indexes, *column.table.constraints]:
+        is_unique = isinstance(constraint, UniqueConstraint) or (isinstance(constraint, Index) and constraint.unique)
+        if is_unique and [indexed.name for indexed in constraint.columns] == [column.name]:
+            return str(constraint.name)
+    raise LookupError(f"{column} has no unique index")
+
+
+# Taken from the model so a renamed or redeclared index cannot silently disable the collision retry
+_TRACKING_ID_UNIQUE_INDEX = _unique_index_name(inspect(Complaint).columns["tracking_id"])
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class StagedUpload(NamedTuple):
+    """An upload spooled to disk by ComplaintService.stage_upload, hashed while it was copied"""
+
+    path: Path
+    file_hash: str
+    size: int
+
+
+class _TTLCache:
+    """Thread-safe in-process cache whose entries expire after a fixed number of seconds"""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Return the cached value for key, computing it if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl:
+                return entry[1]
+            value = compute()
+            self._entries[key] = (time.monotonic(), value)
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Dashboard data tolerates a few seconds of staleness; new complaints invalidate explicitly
+_STATISTICS_CACHE = _TTLCache(ttl=30)
+_RECENT_COMPLAINTS_CACHE = _TTLCache(ttl=10)
+
+
+def _invalidate_caches() -> None:
+    """Drop cached dashboard data after complaints were added or changed"""
+    _STATISTICS_CACHE.clear()
+    _RECENT_COMPLAINTS_CACHE.clear()
+
 
 class ComplaintService:
     """Service layer for handling complaint operations"""
 
     UPLOAD_DIR = Path("uploads")
+    TRACKING_ID_PREFIX = "PC-"
+    TRACKING_ID_BYTES = 5  # 40 random bits, rendered as 10 uppercase hex characters
     MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
+    MAX_TRACKING_ID_ATTEMPTS = 5
+    CHUNK_SIZE = 1024 * 1024  # 1MB read/write buffer for streamed uploads
+    SNIFF_SIZE = 4096  # Leading bytes inspected to confirm a file's real type
+    FILE_HASH_ALGORITHM = "sha256"  # OpenSSL-backed, uses SHA extensions where the CPU has them
+    # ISO-BMFF major brands of MP4 video; others (HEIC/AVIF images, M4A audio, 3GP) are not accepted as video/mp4
+    MP4_BRANDS = frozenset({b"isom", b"iso2", b"iso4", b"iso5", b"iso6", b"mp41", b"mp42", b"avc1", b"M4V ", b"dash"})
     ALLOWED_MIME_TYPES = {
         "image/jpeg",
         "image/png",
@@ -37,16 +146,97 @@ class ComplaintService:
         "text/plain",
     }
 
-    def __init__(self):
+    def __init__(self, upload_dir: Optional[Path] = None):
+        if upload_dir is not None:
+            self.UPLOAD_DIR = upload_dir
         self.UPLOAD_DIR.mkdir(exist_ok=True)
 
     def _generate_tracking_id(self) -> str:
         """Generate a unique tracking ID for anonymous complaint tracking"""
-        return f"PC-{uuid.uuid4().hex[:8].upper()}"
+        return self._generate_tracking_ids(1)[0]
+
+    def _generate_tracking_ids(self, count: int) -> List[str]:
+        """Generate several tracking IDs from a single read of the random source"""
+        random_hex = secrets.token_hex(self.TRACKING_ID_BYTES * count).upper()
+        width = self.TRACKING_ID_BYTES * 2
+        return [f"{self.TRACKING_ID_PREFIX}{random_hex[i : i + width]}" for i in range(0, len(random_hex), width)]
 
     def _calculate_file_hash(self, content: bytes) -> str:
-        """Calculate SHA-256 hash of file content"""
-        return hashlib.sha256(content).hexdigest()
+        """Calculate the FILE_HASH_ALGORITHM hex digest of file content"""
+        return hashlib.new(self.FILE_HASH_ALGORITHM, content).hexdigest()
+
+    def _sniff_mime_type(self, head: bytes) -> Optional[str]:
+        """Detect the MIME type of an allowed binary format from its leading bytes (magic numbers)"""
+        if head.startswith(b"\xff\xd8\xff"):
+            return "image/jpeg"
+        if head.startswith(b"\x89PNG\r\n\x1a\n"):
+            return "image/png"
+        if head.startswith((b"GIF87a", b"GIF89a")):
+            return "image/gif"
+        if head.startswith(b"RIFF") and head[8:12] == b"WEBP":
+            return "image/webp"
+        if head.startswith(b"RIFF") and head[8:12] == b"WAVE":
+            return "audio/wav"
+        if head[4:8] == b"ftyp":
+            if head[8:12] == b"qt  ":
+                return "video/quicktime"
+            return "video/mp4" if head[8:12] in self.MP4_BRANDS else None
+        if head[4:8] in (b"moov", b"mdat", b"wide", b"free"):
+            return "video/quicktime"
+        if head.startswith(b"\x1a\x45\xdf\xa3"):
+            return "video/webm"
+        if head.startswith(b"OggS"):
+            return "audio/ogg"
+        if head.startswith(b"ID3") or self._is_mpeg_audio_frame(head):
+            return "audio/mpeg"
+        if head.startswith(b"%PDF-"):
+            return "application/pdf"
+        return None
+
+    def _is_mpeg_audio_frame(self, head: bytes) -> bool:
+        """Whether head starts with a valid MPEG audio Layer III frame header (an MP3 without an ID3 tag).
+
+        An 11-bit sync word alone also matches e.g. a UTF-16LE byte order mark, so the version, layer,
+        bitrate, sample rate and emphasis fields must all hold allowed values.
+        """
+        if len(head) < 4 or head[0] != 0xFF or head[1] & 0xE0 != 0xE0:
+            return False
+        version = (head[1] >> 3) & 0b11
+        layer = (head[1] >> 1) & 0b11
+        bitrate_index = head[2] >> 4
+        sample_rate_index = (head[2] >> 2) & 0b11
+        emphasis = head[3] & 0b11
+        return (
+            version != 0b01  # reserved
+            and layer == 0b01  # Layer III
+            and bitrate_index not in (0b0000, 0b1111)  # free format / invalid
+            and sample_rate_index != 0b11  # reserved
+            and emphasis != 0b10  # reserved
+        )
+
+    def _verified_mime_type(self, head: bytes, declared_mime_type: str) -> Optional[str]:
+        """MIME type to store for an upload, based on its content rather than the client's claim.
+
+        Returns None if the content is not one of the allowed types.
+        """
+        sniffed = self._sniff_mime_type(head)
+        if sniffed is None:
+            # Plain text has no signature; accept it only if declared as such and free of binary data
+            if declared_mime_type == "text/plain" and b"\x00" not in head:
+                return declared_mime_type
+            return None
+        return sniffed if sniffed in self.ALLOWED_MIME_TYPES else None
+
+    def _read_head(self, content: bytes | BinaryIO | StagedUpload) -> bytes:
+        """Leading bytes of an upload for type sniffing; file objects are rewound to the start"""
+        if isinstance(content, bytes):
+            return content[: self.SNIFF_SIZE]
+        if isinstance(content, StagedUpload):
+            with open(content.path, "rb") as f:
+                return f.read(self.SNIFF_SIZE)
+        head = content.read(self.SNIFF_SIZE)
+        content.seek(0)
+        return head
 
     def _determine_media_type(self, mime_type: str) -> MediaType:
         """Determine media type from MIME type"""
@@ -59,36 +249,76 @@ class ComplaintService:
         else:
             return MediaType.DOCUMENT
 
-    def _save_file(self, content: bytes, filename: str, complaint_id: int) -> Path:
-        """Save uploaded file to disk"""
-        # Create complaint-specific directory
-        complaint_dir = self.UPLOAD_DIR / str(complaint_id)
-        complaint_dir.mkdir(exist_ok=True)
+    def _attachment_path(self, filename: str, tracking_id: str) -> Path:
+        """Final location for a new attachment of the given complaint"""
+        # Create complaint-specific directory, fanned out by the random part of the tracking ID
+        # (uploads/AB/CD/PC-ABCD1234/) so no single directory grows with the number of complaints
+        key = tracking_id.removeprefix(self.TRACKING_ID_PREFIX)
+        complaint_dir = self.UPLOAD_DIR / key[:2] / key[2:4] / tracking_id
+        complaint_dir.mkdir(parents=True, exist_ok=True)
 
         # Generate safe filename
         safe_filename = f"{uuid.uuid4().hex}_{filename}"
-        file_path = complaint_dir / safe_filename
+        return complaint_dir / safe_filename
+
+    def _save_file(self, source: BinaryIO, filename: str, tracking_id: str) -> tuple[Path, str, int]:
+        """Stream uploaded file to disk, hashing it in the same pass.
+
+        Returns the stored path, the FILE_HASH_ALGORITHM hex digest and the number of bytes written.
+        """
+        file_path = self._attachment_path(filename, tracking_id)
+        file_hash, size = self._write_and_hash(source, file_path)
+        return file_path, file_hash, size
 
+    def _write_and_hash(self, source: BinaryIO, file_path: Path) -> tuple[str, int]:
+        """Copy source to file_path in chunks, returning the hex digest and the number of bytes written"""
+        digest = hashlib.new(self.FILE_HASH_ALGORITHM)
+        size = 0
         with open(file_path, "wb") as f:
-            f.write(content)
+            while chunk := source.read(self.CHUNK_SIZE):
+                digest.update(chunk)
+                f.write(chunk)
+                size += len(chunk)
+
+        return digest.hexdigest(), size
+
+    def _move_file(self, staged: StagedUpload, filename: str, tracking_id: str) -> tuple[Path, str, int]:
+        """Move a staged upload into place (a rename on the same filesystem).
+
+        Returns the stored path, the hex digest and the size recorded when the upload was staged.
+        """
+        file_path = self._attachment_path(filename, tracking_id)
+        shutil.move(staged.path, file_path)
+        return file_path, staged.file_hash, staged.size
+
+    def stage_upload(self, staging_key: str, source: BinaryIO) -> StagedUpload:
+        """Spool an incoming upload to a temporary file so it is not held in memory until submission.
 
-        return file_path
+        The file is hashed in the same pass, so attaching it later only has to move it.
+        """
+        staging_dir = self.UPLOAD_DIR / "tmp" / staging_key
+        staging_dir.mkdir(parents=True, exist_ok=True)
+
+        staged_path = staging_dir / uuid.uuid4().hex
+        file_hash, size = self._write_and_hash(source, staged_path)
+        return StagedUpload(staged_path, file_hash, size)
+
+    def discard_staged_uploads(self, staging_key: str) -> None:
+        """Remove any uploads staged under the given key that were never attached"""
+        shutil.rmtree(self.UPLOAD_DIR / "tmp" / staging_key, ignore_errors=True)
+
+    def discard_all_staged_uploads(self) -> None:
+        """Remove every staged upload, e.g. those left behind by a server that stopped before its clients disconnected"""
+        shutil.rmtree(self.UPLOAD_DIR / "tmp", ignore_errors=True)
 
     def create_complaint(
         self, complaint_data: ComplaintCreate, client_ip: Optional[str] = None
     ) -> tuple[Complaint, str]:
         """Create a new anonymous complaint"""
         with get_session() as session:
-            # Generate unique tracking ID
-            tracking_id = self._generate_tracking_id()
-
-            # Ensure tracking ID is unique
-            while session.exec(select(Complaint).where(Complaint.tracking_id == tracking_id)).first():
-                tracking_id = self._generate_tracking_id()
-
             # Create complaint
             complaint = Complaint(
-                tracking_id=tracking_id,
+                tracking_id=self._generate_tracking_id(),
                 title=complaint_data.title,
                 description=complaint_data.description,
                 category=complaint_data.category,
@@ -101,66 +331,122 @@ class ComplaintService:
                 contact_phone=complaint_data.contact_phone,
                 submitted_ip=client_ip,
                 status=ComplaintStatus.PENDING,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
             )
 
-            session.add(complaint)
-            session.commit()
+            # Rely on the unique index on tracking_id and regenerate on the rare collision
+            for attempt in range(self.MAX_TRACKING_ID_ATTEMPTS):
+                session.add(complaint)
+                try:
+                    session.commit()
+                    break
+                except IntegrityError as e:
+                    session.rollback()
+                    if not self._is_tracking_id_collision(e) or attempt == self.MAX_TRACKING_ID_ATTEMPTS - 1:
+                        raise
+                    complaint.tracking_id = self._generate_tracking_id()
+
             session.refresh(complaint)
+            _invalidate_caches()
 
-            return complaint, tracking_id
+            return complaint, complaint.tracking_id
+
+    def _is_tracking_id_collision(self, error: IntegrityError) -> bool:
+        """Whether an insert failed only because its tracking ID is already taken (not e.g. a NOT NULL violation)"""
+        return isinstance(error.orig, UniqueViolation) and error.orig.diag.constraint_name == _TRACKING_ID_UNIQUE_INDEX
 
     def add_media_attachment(
-        self, complaint_id: int, filename: str, content: bytes, mime_type: str
+        self, complaint_id: int, filename: str, content: bytes | BinaryIO | StagedUpload, mime_type: str
     ) -> Optional[MediaAttachment]:
-        """Add media attachment to complaint"""
-        if not self._is_valid_file(content, mime_type):
-            return None
+        """Add media attachment to complaint.
+
+        content is either the file data (bytes or a binary file object) or an upload previously
+        spooled with stage_upload, which is moved into place.
+        """
+        return self.add_media_attachments(complaint_id, [(filename, content, mime_type)])[0]
+
+    def add_media_attachments(
+        self, complaint_id: int, files: Sequence[tuple[str, bytes | BinaryIO | StagedUpload, str]]
+    ) -> List[Optional[MediaAttachment]]:
+        """Add several media attachments to a complaint in a single transaction.
+
+        files holds (filename, content, mime_type) triples, with content as for add_media_attachment.
+        The result is aligned with files; rejected files or files that could not be saved give None.
+        """
+        attachments: List[Optional[MediaAttachment]] = [None] * len(files)
 
         with get_session() as session:
             complaint = session.get(Complaint, complaint_id)
             if not complaint:
-                return None
+                return attachments
 
             try:
-                # Save file to disk
-                file_path = self._save_file(content, filename, complaint_id)
-                file_hash = self._calculate_file_hash(content)
-                media_type = self._determine_media_type(mime_type)
-
-                # Create media attachment record
-                attachment = MediaAttachment(
-                    filename=file_path.name,
-                    original_filename=filename,
-                    file_path=str(file_path),
-                    file_size=len(content),
-                    mime_type=mime_type,
-                    media_type=media_type,
-                    file_hash=file_hash,
-                    complaint_id=complaint_id,
-                    uploaded_at=datetime.utcnow(),
-                    is_processed=True,
-                )
-
-                session.add(attachment)
+                for index, (filename, content, mime_type) in enumerate(files):
+                    try:
+                        if not self._is_valid_upload(self._upload_size(content), mime_type):
+                            continue
+
+                        # Do not trust the client-supplied type; confirm it from the file's leading bytes
+                        verified_mime_type = self._verified_mime_type(self._read_head(content), mime_type)
+                        if verified_mime_type is None:
+                            continue
+
+                        if isinstance(content, StagedUpload):
+                            file_path, file_hash, file_size = self._move_file(content, filename, complaint.tracking_id)
+                        else:
+                            # Save file to disk and hash it in a single pass
+                            source = io.BytesIO(content) if isinstance(content, bytes) else content
+                            file_path, file_hash, file_size = self._save_file(source, filename, complaint.tracking_id)
+                    except OSError as e:
+                        logger.error(f"Failed to save attachment {filename}: {str(e)}")
+                        continue
+
+                    # Create media attachment record
+                    attachments[index] = MediaAttachment(
+                        filename=file_path.name,
+                        original_filename=filename,
+                        file_path=str(file_path),
+                        file_size=file_size,
+                        mime_type=verified_mime_type,
+                        media_type=self._determine_media_type(verified_mime_type),
+                        file_hash=file_hash,
+                        complaint_id=complaint_id,
+                        is_processed=True,
+                    )
+
+                # One commit for all rows; ids and uploaded_at come back from the INSERT, so nothing needs reloading
+                session.add_all([attachment for attachment in attachments if attachment is not None])
+                session.expire_on_commit = False
                 session.commit()
-                session.refresh(attachment)
-                return attachment
+                return attachments
 
             except Exception as e:
-                # Clean up file if database operation fails
-                file_path = locals().get("file_path")
-                if file_path and file_path.exists():
+                # Clean up files if database operation fails
+                for attachment in attachments:
+                    if attachment is None:
+                        continue
                     try:
-                        file_path.unlink()
+                        Path(attachment.file_path).unlink(missing_ok=True)
                     except Exception:
                         pass  # File cleanup failed, but we still want to raise the original exception
                 raise e
 
+    def _upload_size(self, content: bytes | BinaryIO | StagedUpload) -> int:
+        """Size in bytes of an upload without reading it; file objects are rewound to the start"""
+        if isinstance(content, StagedUpload):
+            return content.size
+        if isinstance(content, bytes):
+            return len(content)
+        size = content.seek(0, os.SEEK_END)
+        content.seek(0)
+        return size
+
     def _is_valid_file(self, content: bytes, mime_type: str) -> bool:
         """Validate file content and type"""
-        if len(content) == 0 or len(content) > self.MAX_FILE_SIZE:
+        return self._is_valid_upload(len(content), mime_type)
+
+    def _is_valid_upload(self, size: int, mime_type: str) -> bool:
+        """Validate file size and type"""
+        if not self._is_valid_size(size):
             return False
 
         if mime_type not in self.ALLOWED_MIME_TYPES:
@@ -168,65 +454,81 @@ class ComplaintService:
 
         return True
 
+    def _is_valid_size(self, size: int) -> bool:
+        """Check that a file is neither empty nor over the size limit"""
+        return 0 < size <= self.MAX_FILE_SIZE
+
     def get_complaint_by_tracking_id(self, tracking_id: str) -> Optional[ComplaintPublic]:
         """Get complaint status by tracking ID (public view)"""
         with get_session() as session:
-            complaint = session.exec(select(Complaint).where(Complaint.tracking_id == tracking_id)).first()
+            row = session.exec(_TRACKING_ID_LOOKUP, params={"tracking_id": tracking_id}).first()
 
-            if not complaint:
+            if not row:
                 return None
 
-            return ComplaintPublic(
-                tracking_id=complaint.tracking_id,
-                title=complaint.title,
-                category=complaint.category,
-                status=complaint.status,
-                created_at=complaint.created_at,
-                updated_at=complaint.updated_at,
-            )
+            return _public_from_row(row)
 
-    def get_all_complaints(self, limit: int = 100) -> List[ComplaintPublic]:
-        """Get all complaints (admin view) - limited for performance"""
+    def get_all_complaints(
+        self, limit: int = 100, offset: int = 0, after: Optional[ComplaintPublic] = None
+    ) -> List[ComplaintPublic]:
+        """Get all complaints, newest first (admin view) - limited for performance.
+
+        Pass the last complaint of the previous page as after to continue from it (keyset pagination,
+        no rows are scanned and skipped); offset is only for jumping to pages without a known predecessor.
+        The first page is cached for a short time.
+        """
+        if offset == 0 and after is None:
+            return list(_RECENT_COMPLAINTS_CACHE.get_or_compute(limit, lambda: self._query_all_complaints(limit)))
+        return self._query_all_complaints(limit, offset, after)
+
+    def _query_all_complaints(
+        self, limit: int, offset: int = 0, after: Optional[ComplaintPublic] = None
+    ) -> List[ComplaintPublic]:
         with get_session() as session:
             from sqlmodel import desc
 
-            complaints = session.exec(select(Complaint).order_by(desc(Complaint.created_at)).limit(limit)).all()
-
-            return [
-                ComplaintPublic(
-                    tracking_id=complaint.tracking_id,
-                    title=complaint.title,
-                    category=complaint.category,
-                    status=complaint.status,
-                    created_at=complaint.created_at,
-                    updated_at=complaint.updated_at,
+            # tracking_id is unique, so (created_at, tracking_id) gives a stable total order to page over
+            query = _SELECT_PUBLIC
+            if after is not None:
+                query = query.where(
+                    tuple_(col(Complaint.created_at), col(Complaint.tracking_id))
+                    < tuple_(literal(after.created_at), literal(after.tracking_id))
                 )
-                for complaint in complaints
-            ]
+            rows = session.exec(
+                query.order_by(desc(Complaint.created_at), desc(Complaint.tracking_id)).offset(offset).limit(limit)
+            ).all()
 
-    def get_complaint_statistics(self) -> dict:
-        """Get basic complaint statistics"""
-        with get_session() as session:
-            total_complaints = len(session.exec(select(Complaint)).all())
-            pending_complaints = len(
-                session.exec(select(Complaint).where(Complaint.status == ComplaintStatus.PENDING)).all()
-            )
-            resolved_complaints = len(
-                session.exec(select(Complaint).where(Complaint.status == ComplaintStatus.RESOLVED)).all()
-            )
+            return [_public_from_row(row) for row in rows]
 
-            # Category breakdown
-            categories = {}
-            for category in ComplaintCategory:
-                count = len(session.exec(select(Complaint).where(Complaint.category == category)).all())
-                categories[category.value] = count
+    def get_complaint_statistics(self) -> dict:
+        """Get basic complaint statistics (cached for a short time)"""
+        return _STATISTICS_CACHE.get_or_compute("statistics", self._compute_complaint_statistics)
 
-            return {
-                "total_complaints": total_complaints,
-                "pending_complaints": pending_complaints,
-                "resolved_complaints": resolved_complaints,
-                "categories": categories,
-            }
+    def _compute_complaint_statistics(self) -> dict:
+        with get_session() as session:
+            # One aggregate round trip: at most |statuses| x |categories| x |urgencies| rows
+            rows = session.exec(
+                select(col(Complaint.status), col(Complaint.category), col(Complaint.urgency), func.count()).group_by(
+                    col(Complaint.status), col(Complaint.category), col(Complaint.urgency)
+                )
+            ).all()
+
+        status_counts: Dict[ComplaintStatus, int] = {}
+        category_counts: Dict[ComplaintCategory, int] = {}
+        urgency_counts: Dict[ComplaintUrgency, int] = {}
+        for status, category, urgency, count in rows:
+            status_counts[status] = status_counts.get(status, 0) + count
+            category_counts[category] = category_counts.get(category, 0) + count
+            urgency_counts[urgency] = urgency_counts.get(urgency, 0) + count
+
+        return {
+            "total_complaints": sum(status_counts.values()),
+            "pending_complaints": status_counts.get(ComplaintStatus.PENDING, 0),
+            "resolved_complaints": status_counts.get(ComplaintStatus.RESOLVED, 0),
+            # Breakdowns report 0 for values without complaints
+            "categories": {category.value: category_counts.get(category, 0) for category in ComplaintCategory},
+            "urgencies": {urgency.value: urgency_counts.get(urgency, 0) for urgency in ComplaintUrgency},
+        }
 
     def search_complaints(
         self,
@@ -236,29 +538,18 @@ class ComplaintService:
     ) -> List[ComplaintPublic]:
         """Search complaints with filters"""
         with get_session() as session:
-            query = select(Complaint)
+            query = _SELECT_PUBLIC
 
             if category:
                 query = query.where(Complaint.category == category)
             if status:
                 query = query.where(Complaint.status == status)
             if tracking_id:
-                from sqlmodel import func
-
-                query = query.where(func.upper(Complaint.tracking_id).like(f"%{tracking_id.upper()}%"))
+                # Tracking IDs are stored uppercase; a prefix match on the bare column can use its index
+                query = query.where(col(Complaint.tracking_id).like(f"{tracking_id.upper()}%"))
 
             from sqlmodel import desc
 
-            complaints = session.exec(query.order_by(desc(Complaint.created_at)).limit(50)).all()
+            rows = session.exec(query.order_by(desc(Complaint.created_at)).limit(50)).all()
 
-            return [
-                ComplaintPublic(
-                    tracking_id=complaint.tracking_id,
-                    title=complaint.title,
-                    category=complaint.category,
-                    status=complaint.status,
-                    created_at=complaint.created_at,
-                    updated_at=complaint.updated_at,
-                )
-                for complaint in complaints
-            ]
+            return [_public_from_row(row) for row in rows]
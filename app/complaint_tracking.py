@@ -1,7 +1,40 @@
-from nicegui import ui
+import asyncio
+import re
+from typing import Dict, List, Optional
+
+from nicegui import events, run, ui
 
 from app.complaint_service import ComplaintService
-from app.models import ComplaintStatus
+from app.database import pool_status
+from app.models import ComplaintCategory, ComplaintPublic, ComplaintStatus
+
+# ComplaintService keeps no per-request state (each call opens its own session), so one instance serves all pages
+SERVICE = ComplaintService()
+
+# "PC-" followed by 10 hex characters (8 for IDs issued before the longer format)
+TRACKING_ID_PATTERN = re.compile(r"^PC-(?:[0-9A-F]{8}|[0-9A-F]{10})$")
+
+# Display strings are fixed per enum member, so build them once instead of per row or per search
+CATEGORY_LABELS = {category: category.value.replace("_", " ").title() for category in ComplaintCategory}
+STATUS_LABELS = {status: status.value.replace("_", " ").title() for status in ComplaintStatus}
+
+STATUS_COLORS = {
+    ComplaintStatus.PENDING: "text-yellow-600 bg-yellow-100",
+    ComplaintStatus.UNDER_REVIEW: "text-blue-600 bg-blue-100",
+    ComplaintStatus.RESOLVED: "text-green-600 bg-green-100",
+    ComplaintStatus.DISMISSED: "text-red-600 bg-red-100",
+}
+
+# Date formats for the tracking result (long) and the admin table (short)
+FMT_LONG = "%B %d, %Y at %I:%M %p"
+FMT_SHORT = "%m/%d/%Y %I:%M %p"
+
+STATUS_DESCRIPTIONS = {
+    ComplaintStatus.PENDING: "Your complaint has been received and is waiting for initial review.",
+    ComplaintStatus.UNDER_REVIEW: "Your complaint is currently being investigated by the appropriate department.",
+    ComplaintStatus.RESOLVED: "Your complaint has been reviewed and resolved. Thank you for your submission.",
+    ComplaintStatus.DISMISSED: "Your complaint has been reviewed and closed without further action.",
+}
 
 
 def create():
@@ -10,7 +43,6 @@ def create():
     @ui.page("/track")
     def track_complaint_page():
         """Complaint tracking page"""
-        service = ComplaintService()
 
         with ui.column().classes("w-full max-w-md mx-auto p-4"):
             # Header with back button
@@ -27,96 +59,102 @@ def create():
                     "text-sm text-gray-600 mb-4"
                 )
 
-                tracking_input = ui.input(label="Tracking ID", placeholder="PC-XXXXXXXX").classes("w-full mb-4")
+                tracking_input = ui.input(
+                    label="Tracking ID",
+                    placeholder="PC-XXXXXXXXXX",
+                    validation={
+                        "Invalid tracking ID format": lambda value: bool(
+                            TRACKING_ID_PATTERN.match((value or "").strip().upper())
+                        )
+                    },
+                ).classes("w-full mb-4")
                 tracking_input.props("upper-case")
 
-                # Result container
-                @ui.refreshable
-                def show_complaint_status():
-                    # This will be updated when search is performed
-                    pass
+                # Clicks that arrive before the button is disabled client-side are dropped instead of racing
+                search_lock = asyncio.Lock()
 
                 async def search_complaint():
-                    if not tracking_input.value or len(tracking_input.value.strip()) < 3:
-                        ui.notify("Please enter a valid tracking ID", type="negative")
+                    if search_lock.locked():
                         return
 
-                    complaint = service.get_complaint_by_tracking_id(tracking_input.value.strip().upper())
-
-                    if not complaint:
-                        # Show "not found" message within the refreshable
-                        with show_complaint_status.element:
-                            show_complaint_status.element.clear()
-                            with ui.card().classes("p-4 bg-red-50 border-l-4 border-red-400 mt-4"):
-                                ui.icon("error").classes("text-red-500 text-2xl mb-2")
-                                ui.label("Complaint Not Found").classes("font-semibold text-red-800 mb-2")
-                                ui.label(
-                                    "No complaint found with this tracking ID. Please check the ID and try again."
-                                ).classes("text-sm text-red-700")
+                    # Reject malformed IDs without a database round trip
+                    if not tracking_input.value or not tracking_input.validate():
+                        ui.notify("Please enter a valid tracking ID", type="negative")
                         return
 
-                    # Show complaint details within the refreshable
-                    with show_complaint_status.element:
-                        show_complaint_status.element.clear()
-                        with ui.card().classes("p-4 bg-blue-50 border-l-4 border-blue-400 mt-4"):
-                            ui.label("Complaint Found").classes("font-semibold text-blue-800 mb-4")
-
-                            # Status with color coding
-                            status_color = {
-                                ComplaintStatus.PENDING: "text-yellow-600 bg-yellow-100",
-                                ComplaintStatus.UNDER_REVIEW: "text-blue-600 bg-blue-100",
-                                ComplaintStatus.RESOLVED: "text-green-600 bg-green-100",
-                                ComplaintStatus.DISMISSED: "text-red-600 bg-red-100",
-                            }.get(complaint.status, "text-gray-600 bg-gray-100")
-
-                            ui.label(f"Status: {complaint.status.value.replace('_', ' ').title()}").classes(
-                                f"inline-block px-3 py-1 rounded-full text-sm font-medium {status_color} mb-3"
+                    async with search_lock:
+                        search_button.disable()
+                        search_button.props("loading")
+                        try:
+                            complaint = await run.io_bound(
+                                SERVICE.get_complaint_by_tracking_id, tracking_input.value.strip().upper()
                             )
+                        finally:
+                            search_button.enable()
+                            search_button.props(remove="loading")
+
+                    # Both result cards are built once below; a search only updates texts and toggles visibility
+                    not_found_card.set_visibility(complaint is None)
+                    found_card.set_visibility(complaint is not None)
+                    if complaint is None:
+                        return
 
-                            # Complaint details
-                            with ui.column().classes("gap-2 text-sm"):
-                                with ui.row().classes("justify-between"):
-                                    ui.label("Title:").classes("font-medium text-gray-700")
-                                    ui.label(complaint.title).classes("text-gray-900")
-
-                                with ui.row().classes("justify-between"):
-                                    ui.label("Category:").classes("font-medium text-gray-700")
-                                    ui.label(complaint.category.value.replace("_", " ").title()).classes(
-                                        "text-gray-900"
-                                    )
-
-                                with ui.row().classes("justify-between"):
-                                    ui.label("Submitted:").classes("font-medium text-gray-700")
-                                    ui.label(complaint.created_at.strftime("%B %d, %Y at %I:%M %p")).classes(
-                                        "text-gray-900"
-                                    )
-
-                                with ui.row().classes("justify-between"):
-                                    ui.label("Last Updated:").classes("font-medium text-gray-700")
-                                    ui.label(complaint.updated_at.strftime("%B %d, %Y at %I:%M %p")).classes(
-                                        "text-gray-900"
-                                    )
-
-                            # Status descriptions
-                            status_descriptions = {
-                                ComplaintStatus.PENDING: "Your complaint has been received and is waiting for initial review.",
-                                ComplaintStatus.UNDER_REVIEW: "Your complaint is currently being investigated by the appropriate department.",
-                                ComplaintStatus.RESOLVED: "Your complaint has been reviewed and resolved. Thank you for your submission.",
-                                ComplaintStatus.DISMISSED: "Your complaint has been reviewed and closed without further action.",
-                            }
+                    # Status with color coding
+                    status_color = STATUS_COLORS.get(complaint.status, "text-gray-600 bg-gray-100")
+                    status_label.set_text(f"Status: {STATUS_LABELS[complaint.status]}")
+                    status_label.classes(
+                        replace=f"inline-block px-3 py-1 rounded-full text-sm font-medium {status_color} mb-3"
+                    )
+
+                    title_label.set_text(complaint.title)
+                    category_label.set_text(CATEGORY_LABELS[complaint.category])
+                    submitted_label.set_text(complaint.created_at.strftime(FMT_LONG))
+                    updated_label.set_text(complaint.updated_at.strftime(FMT_LONG))
 
-                            if complaint.status in status_descriptions:
-                                with ui.card().classes("p-3 bg-gray-50 mt-3"):
-                                    ui.label(status_descriptions[complaint.status]).classes("text-sm text-gray-700")
+                    description_card.set_visibility(complaint.status in STATUS_DESCRIPTIONS)
+                    description_label.set_text(STATUS_DESCRIPTIONS.get(complaint.status, ""))
 
                 # Search button
-                ui.button("Search Complaint", on_click=search_complaint).classes(
+                search_button = ui.button("Search Complaint", on_click=search_complaint).classes(
                     "w-full bg-blue-600 hover:bg-blue-700 text-white py-3 px-6 rounded-lg "
                     "text-lg font-medium shadow-lg transition-colors"
                 )
 
-                # Show results area
-                show_complaint_status()
+                # Results area
+                with ui.card().classes("p-4 bg-red-50 border-l-4 border-red-400 mt-4") as not_found_card:
+                    ui.icon("error").classes("text-red-500 text-2xl mb-2")
+                    ui.label("Complaint Not Found").classes("font-semibold text-red-800 mb-2")
+                    ui.label("No complaint found with this tracking ID. Please check the ID and try again.").classes(
+                        "text-sm text-red-700"
+                    )
+                not_found_card.set_visibility(False)
+
+                with ui.card().classes("p-4 bg-blue-50 border-l-4 border-blue-400 mt-4") as found_card:
+                    ui.label("Complaint Found").classes("font-semibold text-blue-800 mb-4")
+                    status_label = ui.label()
+
+                    # Complaint details
+                    with ui.column().classes("gap-2 text-sm"):
+                        with ui.row().classes("justify-between"):
+                            ui.label("Title:").classes("font-medium text-gray-700")
+                            title_label = ui.label().classes("text-gray-900")
+
+                        with ui.row().classes("justify-between"):
+                            ui.label("Category:").classes("font-medium text-gray-700")
+                            category_label = ui.label().classes("text-gray-900")
+
+                        with ui.row().classes("justify-between"):
+                            ui.label("Submitted:").classes("font-medium text-gray-700")
+                            submitted_label = ui.label().classes("text-gray-900")
+
+                        with ui.row().classes("justify-between"):
+                            ui.label("Last Updated:").classes("font-medium text-gray-700")
+                            updated_label = ui.label().classes("text-gray-900")
+
+                    # Status descriptions
+                    with ui.card().classes("p-3 bg-gray-50 mt-3") as description_card:
+                        description_label = ui.label().classes("text-sm text-gray-700")
+                found_card.set_visibility(False)
 
             # Information card
             with ui.card().classes("p-4 bg-yellow-50 border-l-4 border-yellow-400 mt-6"):
@@ -128,16 +166,22 @@ def create():
                 ).classes("text-sm text-yellow-700 whitespace-pre-line")
 
     @ui.page("/admin")
-    def admin_dashboard():
+    async def admin_dashboard():
         """Simple admin dashboard for viewing all complaints"""
-        service = ComplaintService()
+        rows_per_page = 20
+
+        # The statistics and the first page of complaints are independent queries, so run them concurrently
+        stats_task = asyncio.create_task(run.io_bound(SERVICE.get_complaint_statistics))
+        complaints_task = asyncio.create_task(run.io_bound(SERVICE.get_all_complaints, rows_per_page))
+        total_complaints: Optional[int] = None
 
         with ui.column().classes("w-full max-w-6xl mx-auto p-4"):
             ui.label("Complaint Dashboard").classes("text-2xl font-bold text-gray-800 mb-6")
 
             # Statistics cards
             try:
-                stats = service.get_complaint_statistics()
+                stats = await stats_task
+                total_complaints = stats["total_complaints"]
 
                 with ui.row().classes("gap-4 w-full mb-6"):
                     # Total complaints
@@ -162,9 +206,9 @@ def create():
                 logger.error(f"Error loading statistics: {str(e)}")
                 ui.label(f"Error loading statistics: {str(e)}").classes("text-red-600")
 
-            # Recent complaints
+            # Recent complaints, fetched one page at a time as the admin pages through the table
             try:
-                complaints = service.get_all_complaints(limit=20)
+                complaints = await complaints_task
 
                 if complaints:
                     ui.label("Recent Complaints").classes("text-lg font-semibold text-gray-800 mb-4")
@@ -172,24 +216,65 @@ def create():
                     # Create table data
                     columns = [
                         {"name": "tracking_id", "label": "Tracking ID", "field": "tracking_id", "align": "left"},
-                        {"name": "title", "label": "Title", "field": "title", "align": "left"},
+                        # Long titles are cut off with an ellipsis by the browser rather than sliced here
+                        {
+                            "name": "title",
+                            "label": "Title",
+                            "field": "title",
+                            "align": "left",
+                            "classes": "truncate",
+                            "style": "max-width: 300px",
+                        },
                         {"name": "category", "label": "Category", "field": "category", "align": "left"},
                         {"name": "status", "label": "Status", "field": "status", "align": "left"},
                         {"name": "created_at", "label": "Submitted", "field": "created_at", "align": "left"},
                     ]
 
-                    rows = [
-                        {
-                            "tracking_id": complaint.tracking_id,
-                            "title": complaint.title[:50] + ("..." if len(complaint.title) > 50 else ""),
-                            "category": complaint.category.value.replace("_", " ").title(),
-                            "status": complaint.status.value.replace("_", " ").title(),
-                            "created_at": complaint.created_at.strftime("%m/%d/%Y %I:%M %p"),
-                        }
-                        for complaint in complaints
-                    ]
-
-                    ui.table(columns=columns, rows=rows).classes("w-full")
+                    def complaint_rows(page_complaints: List[ComplaintPublic]) -> List[Dict[str, str]]:
+                        return [
+                            {
+                                "tracking_id": complaint.tracking_id,
+                                "title": complaint.title,
+                                "category": CATEGORY_LABELS[complaint.category],
+                                "status": STATUS_LABELS[complaint.status],
+                                "created_at": complaint.created_at.strftime(FMT_SHORT),
+                            }
+                            for complaint in page_complaints
+                        ]
+
+                    # Last complaint of each loaded page, so the next page continues from it instead of an OFFSET
+                    page_cursors: Dict[int, ComplaintPublic] = {1: complaints[-1]}
+
+                    table = (
+                        ui.table(
+                            columns=columns,
+                            rows=complaint_rows(complaints),
+                            row_key="tracking_id",
+                            pagination={
+                                "rowsPerPage": rows_per_page,
+                                "page": 1,
+                                "rowsNumber": total_complaints or len(complaints),
+                            },
+                        )
+                        .props(f':rows-per-page-options="[{rows_per_page}]"')
+                        .classes("w-full")
+                    )
+
+                    async def load_page(e: events.GenericEventArguments) -> None:
+                        page = e.args["pagination"]["page"]
+                        after = page_cursors.get(page - 1)
+                        page_complaints = await run.io_bound(
+                            SERVICE.get_all_complaints,
+                            limit=rows_per_page,
+                            offset=0 if after else (page - 1) * rows_per_page,
+                            after=after,
+                        )
+                        if page_complaints:
+                            page_cursors[page] = page_complaints[-1]
+                        table.rows = complaint_rows(page_complaints)
+                        table.pagination = {**table.pagination, "page": page}
+
+                    table.on("request", load_page)
 
                 else:
                     with ui.card().classes("p-6 bg-gray-50 text-center"):
@@ -202,6 +287,8 @@ def create():
                 logger.error(f"Error loading complaints: {str(e)}")
                 ui.label(f"Error loading complaints: {str(e)}").classes("text-red-600")
 
+            ui.label(f"Database pool: {pool_status()}").classes("text-xs text-gray-400 mt-6")
+
             # Back to public interface
             ui.button("Back to Public Interface", on_click=lambda: ui.navigate.to("/")).classes(
                 "bg-gray-600 hover:bg-gray-700 text-white py-2 px-4 rounded mt-6"
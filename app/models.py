@@ -1,4 +1,5 @@
-from sqlmodel import SQLModel, Field, Relationship, JSON, Column
+from sqlmodel import SQLModel, Field, Relationship, JSON, Column, DateTime, Index, func, text
+from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from enum import Enum
@@ -36,9 +37,24 @@ class MediaType(str, Enum):
     DOCUMENT = "document"
 
 
+def _utc_timestamp_column(**kwargs: Any) -> Column:
+    """Naive UTC timestamp filled in by the database, so inserts don't depend on the app server's clock.
+
+    Fields using it default to None, which the ORM leaves out of the INSERT; the stored value is
+    fetched back with RETURNING.
+    """
+    return Column(DateTime, server_default=text("timezone('utc', now())"), nullable=False, **kwargs)
+
+
 # Persistent models (stored in database)
 class Complaint(SQLModel, table=True):
     __tablename__ = "complaints"  # type: ignore[assignment]
+    __table_args__ = (
+        # Lets prefix LIKE searches on tracking_id use an index regardless of the database collation
+        Index("ix_complaints_tracking_id_prefix", "tracking_id", postgresql_ops={"tracking_id": "varchar_pattern_ops"}),
+        # Status filters/counts and "latest by status" listings; also covers lookups on status alone
+        Index("ix_complaints_status_created", "status", "created_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
 
@@ -48,7 +64,7 @@ class Complaint(SQLModel, table=True):
     # Complaint details
     title: str = Field(max_length=200)
     description: str = Field(max_length=5000)
-    category: ComplaintCategory = Field(default=ComplaintCategory.OTHER)
+    category: ComplaintCategory = Field(default=ComplaintCategory.OTHER, index=True)
     urgency: ComplaintUrgency = Field(default=ComplaintUrgency.MEDIUM)
 
     # Location and incident details
@@ -63,14 +79,20 @@ class Complaint(SQLModel, table=True):
 
     # System fields
     status: ComplaintStatus = Field(default=ComplaintStatus.PENDING)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    # The created_at B-tree also serves ORDER BY created_at DESC
+    created_at: Optional[datetime] = Field(default=None, sa_column=_utc_timestamp_column(index=True))
+    updated_at: Optional[datetime] = Field(
+        default=None, sa_column=_utc_timestamp_column(onupdate=func.timezone("utc", func.now()))
+    )
 
     # IP address for basic tracking (anonymized after processing)
     submitted_ip: Optional[str] = Field(default=None, max_length=45)
 
     # Additional metadata
-    additional_metadata: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
+    # JSONB is stored pre-parsed; public/admin queries select explicit columns, so this is only read when asked for
+    additional_metadata: Dict[str, Any] = Field(
+        default_factory=dict, sa_column=Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
+    )
 
     # Relationships
     media_attachments: List["MediaAttachment"] = Relationship(back_populates="complaint")
@@ -93,7 +115,7 @@ class MediaAttachment(SQLModel, table=True):
     file_hash: str = Field(max_length=128)
 
     # Metadata
-    uploaded_at: datetime = Field(default_factory=datetime.utcnow)
+    uploaded_at: Optional[datetime] = Field(default=None, sa_column=_utc_timestamp_column())
     is_processed: bool = Field(default=False)
 
     # Foreign key
@@ -113,7 +135,7 @@ class ComplaintNote(SQLModel, table=True):
     # Note content
     note: str = Field(max_length=2000)
     created_by: str = Field(max_length=100)  # Admin/reviewer identifier
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_utc_timestamp_column())
 
     # Foreign key
     complaint_id: int = Field(foreign_key="complaints.id")
@@ -132,12 +154,12 @@ class ComplaintStatistic(SQLModel, table=True):
 
     # Statistics
     total_complaints: int = Field(default=0)
-    by_category: Dict[str, int] = Field(default={}, sa_column=Column(JSON))
-    by_status: Dict[str, int] = Field(default={}, sa_column=Column(JSON))
-    by_urgency: Dict[str, int] = Field(default={}, sa_column=Column(JSON))
+    by_category: Dict[str, int] = Field(default_factory=dict, sa_column=Column(JSON, nullable=False))
+    by_status: Dict[str, int] = Field(default_factory=dict, sa_column=Column(JSON, nullable=False))
+    by_urgency: Dict[str, int] = Field(default_factory=dict, sa_column=Column(JSON, nullable=False))
 
     # Generated timestamp
-    generated_at: datetime = Field(default_factory=datetime.utcnow)
+    generated_at: Optional[datetime] = Field(default=None, sa_column=_utc_timestamp_column())
 
 
 # Non-persistent schemas (for validation, forms, API requests/responses)
@@ -1,12 +1,18 @@
+from app.complaint_service import ComplaintService
 from app.database import create_tables
-import app.complaint_form
-import app.complaint_tracking
 
 
 def startup() -> None:
     # this function is called before the first request
     create_tables()
 
+    # Staged uploads are only attached within a client session, so any left from a previous run are orphans
+    ComplaintService().discard_all_staged_uploads()
+
+    # Import UI modules only once the schema exists, keeping them off the interpreter start-up path
+    import app.complaint_form
+    import app.complaint_tracking
+
     # Register all modules
     app.complaint_form.create()
     app.complaint_tracking.create()
@@ -1,5 +1,9 @@
-from typing import Generator
+from datetime import datetime, timedelta
+from typing import Callable, Generator, List
 import pytest
+from app.complaint_service import ComplaintService, _invalidate_caches
+from app.database import get_session, reset_db
+from app.models import Complaint, ComplaintCreate
 from app.startup import startup
 from nicegui.testing import User
 
@@ -10,3 +14,43 @@ pytest_plugins = ["nicegui.testing.plugin"]
 def user(user: User) -> Generator[User, None, None]:
     startup()
     yield user
+
+
+@pytest.fixture(scope="session")
+def db_schema():
+    # Drop and recreate the schema once; individual tests only empty the tables
+    reset_db()
+    yield
+    reset_db()
+
+
+@pytest.fixture(scope="session")
+def bulk_create_complaints() -> Callable[[List[ComplaintCreate]], List[str]]:
+    """Helper inserting complaints in one transaction, for tests that need rows but not the creation logic"""
+    return _bulk_create_complaints
+
+
+def _bulk_create_complaints(complaints_data: List[ComplaintCreate]) -> List[str]:
+    """Insert complaints in one transaction, skipping the per-row work of ComplaintService.create_complaint.
+
+    Complaints are one second apart in list order, so the last one is the newest.
+    Returns the tracking IDs in the same order.
+    """
+    created_at = datetime(2024, 1, 1)
+    tracking_ids = ComplaintService()._generate_tracking_ids(len(complaints_data))
+    complaints = [
+        Complaint(
+            **complaint_data.model_dump(),
+            tracking_id=tracking_ids[index],
+            created_at=created_at + timedelta(seconds=index),
+            updated_at=created_at + timedelta(seconds=index),
+        )
+        for index, complaint_data in enumerate(complaints_data)
+    ]
+
+    with get_session() as session:
+        session.add_all(complaints)
+        session.commit()
+
+    _invalidate_caches()
+    return tracking_ids
@@ -0,0 +1,60 @@
+import pytest
+from typing import Dict
+
+from app.database import clear_db
+from app.complaint_service import ComplaintService
+from app.models import ComplaintCreate, ComplaintCategory
+
+
+# Complaints the search tests run against. None of the tests in this module write to the database,
+# so the corpus is inserted once for the whole module.
+SEARCH_CORPUS = [
+    ComplaintCreate(title="Misconduct complaint", description="Description", category=ComplaintCategory.MISCONDUCT),
+    ComplaintCreate(title="Harassment complaint", description="Description", category=ComplaintCategory.HARASSMENT),
+    ComplaintCreate(title="Searchable complaint", description="This complaint should be searchable"),
+]
+
+
+@pytest.fixture(scope="module")
+def search_corpus(db_schema, bulk_create_complaints) -> Dict[ComplaintCategory, str]:
+    """SEARCH_CORPUS inserted in one transaction into empty tables, as tracking IDs keyed by category"""
+    clear_db()
+    tracking_ids = bulk_create_complaints(SEARCH_CORPUS)
+    return {complaint_data.category: tracking_id for complaint_data, tracking_id in zip(SEARCH_CORPUS, tracking_ids)}
+
+
+@pytest.fixture(scope="module")
+def service(tmp_path_factory):
+    return ComplaintService(tmp_path_factory.mktemp("uploads"))
+
+
+def test_search_complaints_by_category(search_corpus, service: ComplaintService):
+    """Test searching complaints by category"""
+    # Search for misconduct complaints
+    misconduct_complaints = service.search_complaints(category=ComplaintCategory.MISCONDUCT)
+    assert len(misconduct_complaints) == 1
+    assert misconduct_complaints[0].title == "Misconduct complaint"
+    assert misconduct_complaints[0].tracking_id == search_corpus[ComplaintCategory.MISCONDUCT]
+
+    # Search for harassment complaints
+    harassment_complaints = service.search_complaints(category=ComplaintCategory.HARASSMENT)
+    assert len(harassment_complaints) == 1
+    assert harassment_complaints[0].title == "Harassment complaint"
+
+
+def test_search_complaints_by_tracking_id(search_corpus, service: ComplaintService):
+    """Test searching complaints by tracking ID partial match"""
+    tracking_id = search_corpus[ComplaintCategory.OTHER]
+
+    # Search with partial tracking ID
+    partial_id = tracking_id[:9]  # 'PC-' + 6 hex characters
+    results = service.search_complaints(tracking_id=partial_id)
+
+    assert len(results) == 1
+    assert results[0].tracking_id == tracking_id
+
+
+def test_search_complaints_no_results(search_corpus, service: ComplaintService):
+    """Test search with no matching results"""
+    results = service.search_complaints(category=ComplaintCategory.CORRUPTION)
+    assert len(results) == 0
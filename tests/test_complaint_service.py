@@ -1,36 +1,43 @@
 import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import inspect
+from sqlmodel import text
 from datetime import datetime
+from io import BytesIO
 from pathlib import Path
-import tempfile
+from typing import List
 import shutil
 
-from app.database import reset_db
-from app.complaint_service import ComplaintService
-from app.models import ComplaintCreate, ComplaintCategory, ComplaintUrgency, ComplaintStatus
+from app.database import ENGINE, clear_db, create_tables
+from app.complaint_service import ComplaintService, _invalidate_caches, _unique_index_name
+from app.models import Complaint, ComplaintCreate, ComplaintCategory, ComplaintUrgency, ComplaintStatus, MediaType
 
 
-@pytest.fixture()
-def new_db():
-    reset_db()
-    yield
-    reset_db()
+UPPER_HEX_DIGITS = frozenset("0123456789ABCDEF")
+LOWER_HEX_DIGITS = frozenset("0123456789abcdef")
+
+# Shared input for tests that only need some complaint to exist; the service never mutates it
+BASIC_COMPLAINT = ComplaintCreate(title="Test complaint", description="This is a test complaint description")
 
 
 @pytest.fixture()
-def service():
-    # Create a temporary upload directory for testing
-    temp_dir = Path(tempfile.mkdtemp())
+def new_db(db_schema):
+    clear_db()
+    _invalidate_caches()  # Dashboard data cached by an earlier test would outlive its rows
+    yield
 
-    service = ComplaintService()
-    original_upload_dir = service.UPLOAD_DIR
-    service.UPLOAD_DIR = temp_dir
 
-    yield service
+@pytest.fixture(scope="module")
+def service(tmp_path_factory):
+    # Most tests never touch the disk, so share one service and upload directory across the module
+    return ComplaintService(tmp_path_factory.mktemp("uploads"))
 
-    # Cleanup
-    if temp_dir.exists():
-        shutil.rmtree(temp_dir)
-    service.UPLOAD_DIR = original_upload_dir
+
+@pytest.fixture()
+def clean_uploads(service: ComplaintService):
+    """Empty upload directory, for tests that write attachments"""
+    shutil.rmtree(service.UPLOAD_DIR, ignore_errors=True)
+    service.UPLOAD_DIR.mkdir()
 
 
 def test_generate_tracking_id(service: ComplaintService):
@@ -38,9 +45,19 @@ def test_generate_tracking_id(service: ComplaintService):
     tracking_id = service._generate_tracking_id()
 
     assert tracking_id.startswith("PC-")
-    assert len(tracking_id) == 11  # 'PC-' + 8 hex characters
+    assert len(tracking_id) == 13  # 'PC-' + 10 hex characters
     assert tracking_id[3:].isupper()
-    assert all(c in "0123456789ABCDEF" for c in tracking_id[3:])
+    assert set(tracking_id[3:]) <= UPPER_HEX_DIGITS
+
+
+def test_generate_tracking_ids(service: ComplaintService):
+    """Test batch tracking ID generation"""
+    tracking_ids = service._generate_tracking_ids(5)
+
+    assert len(tracking_ids) == 5
+    assert len(set(tracking_ids)) == 5
+    assert all(tracking_id.startswith("PC-") and len(tracking_id) == 13 for tracking_id in tracking_ids)
+    assert service._generate_tracking_ids(0) == []
 
 
 def test_calculate_file_hash(service: ComplaintService):
@@ -48,42 +65,92 @@ def test_calculate_file_hash(service: ComplaintService):
     test_content = b"test file content"
     hash_value = service._calculate_file_hash(test_content)
 
-    assert len(hash_value) == 64  # SHA-256 produces 64-character hex string
-    assert all(c in "0123456789abcdef" for c in hash_value)
+    # Fixed-length lowercase hex digest, whatever FILE_HASH_ALGORITHM is
+    assert len(hash_value) == len(service._calculate_file_hash(b""))
+    assert set(hash_value) <= LOWER_HEX_DIGITS
+    assert hash_value != service._calculate_file_hash(b"other content")
 
     # Same content should produce same hash
     assert service._calculate_file_hash(test_content) == hash_value
 
 
-def test_determine_media_type(service: ComplaintService):
+MEDIA_TYPE_CASES = [
+    ("image/jpeg", MediaType.IMAGE),
+    ("image/png", MediaType.IMAGE),
+    ("video/mp4", MediaType.VIDEO),
+    ("video/webm", MediaType.VIDEO),
+    ("audio/mpeg", MediaType.AUDIO),
+    ("audio/wav", MediaType.AUDIO),
+    ("application/pdf", MediaType.DOCUMENT),
+    ("text/plain", MediaType.DOCUMENT),
+]
+
+
+@pytest.mark.parametrize("mime_type,expected", MEDIA_TYPE_CASES, ids=[mime for mime, _ in MEDIA_TYPE_CASES])
+def test_determine_media_type(service: ComplaintService, mime_type: str, expected: MediaType):
     """Test media type determination from MIME types"""
-    from app.models import MediaType
+    assert service._determine_media_type(mime_type) == expected
 
-    assert service._determine_media_type("image/jpeg") == MediaType.IMAGE
-    assert service._determine_media_type("image/png") == MediaType.IMAGE
-    assert service._determine_media_type("video/mp4") == MediaType.VIDEO
-    assert service._determine_media_type("video/webm") == MediaType.VIDEO
-    assert service._determine_media_type("audio/mpeg") == MediaType.AUDIO
-    assert service._determine_media_type("audio/wav") == MediaType.AUDIO
-    assert service._determine_media_type("application/pdf") == MediaType.DOCUMENT
-    assert service._determine_media_type("text/plain") == MediaType.DOCUMENT
 
+def test_sniff_mime_type(service: ComplaintService):
+    """Test MIME detection from leading bytes"""
+    assert service._sniff_mime_type(b"\xff\xd8\xff\xe0rest") == "image/jpeg"
+    assert service._sniff_mime_type(b"\x89PNG\r\n\x1a\nrest") == "image/png"
+    assert service._sniff_mime_type(b"RIFF\x00\x00\x00\x00WEBPVP8 ") == "image/webp"
+    assert service._sniff_mime_type(b"RIFF\x00\x00\x00\x00WAVEfmt ") == "audio/wav"
+    assert service._sniff_mime_type(b"\x00\x00\x00\x18ftypisom") == "video/mp4"
+    assert service._sniff_mime_type(b"\x00\x00\x00\x14ftypqt  ") == "video/quicktime"
+    assert service._sniff_mime_type(b"ID3\x04\x00") == "audio/mpeg"
+    assert service._sniff_mime_type(b"\xff\xfb\x90\x64rest") == "audio/mpeg"  # MPEG-1 Layer III frame, no ID3 tag
+    assert service._sniff_mime_type(b"%PDF-1.7") == "application/pdf"
+    assert service._sniff_mime_type(b"just some text") is None
 
-def test_is_valid_file(service: ComplaintService):
-    """Test file validation"""
-    # Valid files
-    assert service._is_valid_file(b"valid content", "image/jpeg")
-    assert service._is_valid_file(b"pdf content", "application/pdf")
+    # Other ISO-BMFF brands are not MP4 video
+    assert service._sniff_mime_type(b"\x00\x00\x00\x18ftypheic") is None
+    assert service._sniff_mime_type(b"\x00\x00\x00\x1cftypavif") is None
+    assert service._sniff_mime_type(b"\x00\x00\x00\x20ftypM4A ") is None
+
+    # A bare 0xFFE sync word is not enough for MP3
+    assert service._sniff_mime_type("\ufeffnotes".encode("utf-16-le")) is None  # UTF-16LE BOM, FF FE
+    assert service._sniff_mime_type(b"\xff\xf3" + b"\x00" * 16) is None
 
-    # Empty file
-    assert not service._is_valid_file(b"", "image/jpeg")
 
-    # File too large
-    large_content = b"x" * (51 * 1024 * 1024)  # 51MB
-    assert not service._is_valid_file(large_content, "image/jpeg")
+def test_verified_mime_type(service: ComplaintService):
+    """Test that the stored MIME type comes from the content, not the client"""
+    # Detected type wins over the declared one
+    assert service._verified_mime_type(b"\x89PNG\r\n\x1a\nrest", "image/jpeg") == "image/png"
 
-    # Invalid MIME type
-    assert not service._is_valid_file(b"content", "application/octet-stream")
+    # Plain text is accepted only when declared and free of binary data
+    assert service._verified_mime_type(b"some notes", "text/plain") == "text/plain"
+    assert service._verified_mime_type(b"MZ\x90\x00\x03", "text/plain") is None
+
+    # Content that only resembles an MP3 frame sync is not accepted under any declared type
+    assert service._verified_mime_type(b"\xff\xf3" + b"\x00" * 16, "image/png") is None
+    assert service._verified_mime_type("\ufeffnotes".encode("utf-16-le"), "text/plain") is None
+
+    # Unrecognised content claiming to be an image is rejected
+    assert service._verified_mime_type(b"not really an image", "image/jpeg") is None
+
+
+VALID_FILE_CASES = [
+    pytest.param(b"valid content", "image/jpeg", True, id="jpeg"),
+    pytest.param(b"pdf content", "application/pdf", True, id="pdf"),
+    pytest.param(b"", "image/jpeg", False, id="empty"),
+    pytest.param(b"content", "application/octet-stream", False, id="unsupported-type"),
+]
+
+
+@pytest.mark.parametrize("content,mime_type,expected", VALID_FILE_CASES)
+def test_is_valid_file(service: ComplaintService, content: bytes, mime_type: str, expected: bool):
+    """Test file validation"""
+    assert service._is_valid_file(content, mime_type) == expected
+
+
+def test_is_valid_size(service: ComplaintService):
+    """Test the file size limit without allocating a file of that size"""
+    assert service._is_valid_size(service.MAX_FILE_SIZE)
+    assert not service._is_valid_size(51 * 1024 * 1024)  # 51MB
+    assert not service._is_valid_size(0)
 
 
 def test_create_complaint_basic(new_db, service: ComplaintService):
@@ -110,6 +177,17 @@ def test_create_complaint_basic(new_db, service: ComplaintService):
     assert complaint.updated_at is not None
 
 
+def test_create_tables_adds_missing_column_defaults(new_db, service: ComplaintService):
+    """Test that tables created before a column got its server default are brought up to date"""
+    with ENGINE.begin() as connection:
+        connection.execute(text("ALTER TABLE complaints ALTER COLUMN created_at DROP DEFAULT"))
+
+    create_tables()
+
+    complaint, _ = service.create_complaint(BASIC_COMPLAINT)
+    assert complaint.created_at is not None
+
+
 def test_create_complaint_with_optional_fields(new_db, service: ComplaintService):
     """Test complaint creation with optional fields"""
     incident_date = datetime(2024, 1, 15, 14, 30)
@@ -139,15 +217,58 @@ def test_create_complaint_with_optional_fields(new_db, service: ComplaintService
 
 def test_create_complaint_unique_tracking_id(new_db, service: ComplaintService):
     """Test that tracking IDs are unique"""
-    complaint_data = ComplaintCreate(title="Test complaint", description="This is a test complaint description")
-
-    complaint1, tracking_id1 = service.create_complaint(complaint_data)
-    complaint2, tracking_id2 = service.create_complaint(complaint_data)
+    complaint1, tracking_id1 = service.create_complaint(BASIC_COMPLAINT)
+    complaint2, tracking_id2 = service.create_complaint(BASIC_COMPLAINT)
 
     assert tracking_id1 != tracking_id2
     assert complaint1.tracking_id != complaint2.tracking_id
 
 
+class CollidingTrackingIdService(ComplaintService):
+    """Hands out the given tracking IDs before falling back to random ones"""
+
+    def __init__(self, tracking_ids: List[str]):
+        super().__init__()
+        self.tracking_ids = list(tracking_ids)
+        self.generated = 0
+
+    def _generate_tracking_id(self) -> str:
+        self.generated += 1
+        return self.tracking_ids.pop(0) if self.tracking_ids else super()._generate_tracking_id()
+
+
+def test_unique_index_name():
+    """Test that the collision check finds the tracking ID index from the model"""
+    columns = inspect(Complaint).columns
+    unique_indexes = {index.name for index in columns["tracking_id"].table.indexes if index.unique}
+    assert _unique_index_name(columns["tracking_id"]) in unique_indexes  # Not the non-unique prefix index
+    with pytest.raises(LookupError):
+        _unique_index_name(columns["category"])  # Indexed, but not unique
+
+
+def test_create_complaint_retries_tracking_id_collision(new_db, service: ComplaintService):
+    """Test that a colliding tracking ID is replaced and the insert retried"""
+    _, taken_id = service.create_complaint(BASIC_COMPLAINT)
+
+    colliding_service = CollidingTrackingIdService([taken_id])
+    complaint, tracking_id = colliding_service.create_complaint(BASIC_COMPLAINT)
+
+    assert complaint.id is not None
+    assert tracking_id != taken_id
+    assert colliding_service.generated == 2
+
+
+def test_create_complaint_gives_up_after_repeated_collisions(new_db, service: ComplaintService):
+    """Test that the retry loop is bounded"""
+    _, taken_id = service.create_complaint(BASIC_COMPLAINT)
+
+    colliding_service = CollidingTrackingIdService([taken_id] * ComplaintService.MAX_TRACKING_ID_ATTEMPTS)
+    with pytest.raises(IntegrityError):
+        colliding_service.create_complaint(BASIC_COMPLAINT)
+
+    assert colliding_service.generated == ComplaintService.MAX_TRACKING_ID_ATTEMPTS
+
+
 def test_get_complaint_by_tracking_id(new_db, service: ComplaintService):
     """Test retrieving complaint by tracking ID"""
     complaint_data = ComplaintCreate(title="Findable complaint", description="This complaint should be findable")
@@ -170,7 +291,7 @@ def test_get_complaint_by_tracking_id_not_found(new_db, service: ComplaintServic
     assert found_complaint is None
 
 
-def test_add_media_attachment(new_db, service: ComplaintService):
+def test_add_media_attachment(new_db, clean_uploads, service: ComplaintService):
     """Test adding media attachment to complaint"""
     # Create a complaint first
     complaint_data = ComplaintCreate(
@@ -183,7 +304,7 @@ def test_add_media_attachment(new_db, service: ComplaintService):
     assert complaint.id is not None
 
     # Add media attachment
-    test_content = b"fake image content"
+    test_content = b"\xff\xd8\xff\xe0fake image content"
     attachment = service.add_media_attachment(complaint.id, "test_image.jpg", test_content, "image/jpeg")
 
     assert attachment is not None
@@ -194,18 +315,103 @@ def test_add_media_attachment(new_db, service: ComplaintService):
     assert attachment.media_type.value == "image"
     assert attachment.complaint_id == complaint.id
     assert attachment.is_processed
+    assert attachment.uploaded_at is not None  # Filled in by the database default
+
+    # Verify file was saved; the stored hash vouches for its content
+    assert Path(attachment.file_path).stat().st_size == len(test_content)
+    assert attachment.file_hash == service._calculate_file_hash(test_content)
+
+
+def test_add_media_attachments_batch(new_db, clean_uploads, service: ComplaintService):
+    """Test adding several attachments in one call"""
+    complaint_data = ComplaintCreate(title="Complaint with files", description="This complaint has several files")
+
+    complaint, _ = service.create_complaint(complaint_data)
+    assert complaint.id is not None
+
+    attachments = service.add_media_attachments(
+        complaint.id,
+        [
+            ("photo.jpg", b"\xff\xd8\xff\xe0fake image content", "image/jpeg"),
+            ("malware.exe", b"executable content", "application/x-executable"),
+            ("notes.txt", b"some notes", "text/plain"),
+        ],
+    )
+
+    assert len(attachments) == 3
+    assert attachments[0] is not None
+    assert attachments[0].id is not None
+    assert attachments[0].media_type.value == "image"
+    assert attachments[1] is None  # Unsupported MIME type is skipped
+    assert attachments[2] is not None
+    assert attachments[2].media_type.value == "document"
+    assert Path(attachments[2].file_path).read_bytes() == b"some notes"
 
-    # Verify file was saved
+
+def test_stage_upload(clean_uploads, service: ComplaintService):
+    """Test that staging an upload records its digest and size while copying it"""
+    test_content = b"%PDF-1.7 staged document"
+
+    staged = service.stage_upload("session-key", BytesIO(test_content))
+
+    assert staged.path.parent == service.UPLOAD_DIR / "tmp" / "session-key"
+    assert staged.path.read_bytes() == test_content
+    assert staged.file_hash == service._calculate_file_hash(test_content)
+    assert staged.size == len(test_content)
+
+
+def test_add_media_attachments_staged(new_db, clean_uploads, service: ComplaintService):
+    """Test attaching a staged upload moves it into the complaint's directory"""
+    complaint, tracking_id = service.create_complaint(BASIC_COMPLAINT)
+    assert complaint.id is not None
+
+    test_content = b"%PDF-1.7 staged document"
+    staged = service.stage_upload("session-key", BytesIO(test_content))
+
+    attachments = service.add_media_attachments(complaint.id, [("report.pdf", staged, "application/pdf")])
+
+    attachment = attachments[0]
+    assert attachment is not None
+    assert attachment.id is not None
+    assert attachment.file_size == len(test_content)
+    assert attachment.file_hash == staged.file_hash
+    assert attachment.media_type == MediaType.DOCUMENT
+
+    key = tracking_id.removeprefix(service.TRACKING_ID_PREFIX)
     file_path = Path(attachment.file_path)
-    assert file_path.exists()
+    assert file_path.parent == service.UPLOAD_DIR / key[:2] / key[2:4] / tracking_id
     assert file_path.read_bytes() == test_content
+    assert not staged.path.exists()
+
+
+def test_discard_staged_uploads(clean_uploads, service: ComplaintService):
+    """Test that abandoned staged uploads are removed, and that discarding twice is harmless"""
+    staged = service.stage_upload("session-key", BytesIO(b"some notes"))
+    other = service.stage_upload("other-key", BytesIO(b"other notes"))
+
+    service.discard_staged_uploads("session-key")
+    service.discard_staged_uploads("session-key")
+
+    assert not staged.path.parent.exists()
+    assert other.path.exists()
+
+
+def test_discard_all_staged_uploads(clean_uploads, service: ComplaintService):
+    """Test that clearing the staging area leaves attached uploads alone"""
+    service.stage_upload("session-key", BytesIO(b"some notes"))
+    attached = service.UPLOAD_DIR / "AB" / "CD" / "PC-ABCD123456" / "notes.txt"
+    attached.parent.mkdir(parents=True)
+    attached.write_bytes(b"attached notes")
+
+    service.discard_all_staged_uploads()
+
+    assert not (service.UPLOAD_DIR / "tmp").exists()
+    assert attached.exists()
 
 
 def test_add_media_attachment_invalid_file(new_db, service: ComplaintService):
     """Test adding invalid media attachment"""
-    complaint_data = ComplaintCreate(title="Test complaint", description="Test description")
-
-    complaint, _ = service.create_complaint(complaint_data)
+    complaint, _ = service.create_complaint(BASIC_COMPLAINT)
 
     # Ensure complaint was created successfully
     assert complaint.id is not None
@@ -218,6 +424,16 @@ def test_add_media_attachment_invalid_file(new_db, service: ComplaintService):
     assert attachment is None
 
 
+def test_add_media_attachment_spoofed_type(new_db, service: ComplaintService):
+    """Test that content not matching any allowed type is rejected regardless of the declared type"""
+    complaint, _ = service.create_complaint(BASIC_COMPLAINT)
+    assert complaint.id is not None
+
+    attachment = service.add_media_attachment(complaint.id, "photo.jpg", b"MZ\x90\x00executable", "image/jpeg")
+
+    assert attachment is None
+
+
 def test_add_media_attachment_nonexistent_complaint(new_db, service: ComplaintService):
     """Test adding media attachment to non-existent complaint"""
     attachment = service.add_media_attachment(
@@ -230,16 +446,19 @@ def test_add_media_attachment_nonexistent_complaint(new_db, service: ComplaintSe
     assert attachment is None
 
 
-def test_get_all_complaints(new_db, service: ComplaintService):
+def test_get_all_complaints(new_db, bulk_create_complaints, service: ComplaintService):
     """Test retrieving all complaints"""
     # Create multiple complaints
-    for i in range(3):
-        complaint_data = ComplaintCreate(
-            title=f"Complaint {i + 1}",
-            description=f"Description for complaint {i + 1}",
-            category=ComplaintCategory.MISCONDUCT,
-        )
-        service.create_complaint(complaint_data)
+    bulk_create_complaints(
+        [
+            ComplaintCreate(
+                title=f"Complaint {i + 1}",
+                description=f"Description for complaint {i + 1}",
+                category=ComplaintCategory.MISCONDUCT,
+            )
+            for i in range(3)
+        ]
+    )
 
     complaints = service.get_all_complaints()
 
@@ -250,19 +469,37 @@ def test_get_all_complaints(new_db, service: ComplaintService):
     assert complaints[2].title == "Complaint 1"
 
 
-def test_get_all_complaints_limit(new_db, service: ComplaintService):
+def test_get_all_complaints_limit(new_db, bulk_create_complaints, service: ComplaintService):
     """Test retrieving complaints with limit"""
     # Create 5 complaints
-    for i in range(5):
-        complaint_data = ComplaintCreate(title=f"Complaint {i + 1}", description=f"Description {i + 1}")
-        service.create_complaint(complaint_data)
+    bulk_create_complaints(
+        [ComplaintCreate(title=f"Complaint {i + 1}", description=f"Description {i + 1}") for i in range(5)]
+    )
 
     complaints = service.get_all_complaints(limit=3)
 
     assert len(complaints) == 3
 
 
-def test_get_complaint_statistics(new_db, service: ComplaintService):
+def test_get_all_complaints_pagination(new_db, bulk_create_complaints, service: ComplaintService):
+    """Test paging through complaints by offset and by cursor"""
+    bulk_create_complaints(
+        [ComplaintCreate(title=f"Complaint {i + 1}", description=f"Description {i + 1}") for i in range(5)]
+    )
+
+    first_page = service.get_all_complaints(limit=2)
+    by_cursor = service.get_all_complaints(limit=2, after=first_page[-1])
+    by_offset = service.get_all_complaints(limit=2, offset=2)
+
+    assert [c.title for c in first_page] == ["Complaint 5", "Complaint 4"]
+    assert [c.title for c in by_cursor] == ["Complaint 3", "Complaint 2"]
+    assert [c.tracking_id for c in by_offset] == [c.tracking_id for c in by_cursor]
+
+    last_page = service.get_all_complaints(limit=2, after=by_cursor[-1])
+    assert [c.title for c in last_page] == ["Complaint 1"]
+
+
+def test_get_complaint_statistics(new_db, bulk_create_complaints, service: ComplaintService):
     """Test getting complaint statistics"""
     # Create complaints with different categories and statuses
     complaints_data = [
@@ -271,8 +508,7 @@ def test_get_complaint_statistics(new_db, service: ComplaintService):
         ComplaintCreate(title="Harassment", description="Description", category=ComplaintCategory.HARASSMENT),
     ]
 
-    for complaint_data in complaints_data:
-        service.create_complaint(complaint_data)
+    bulk_create_complaints(complaints_data)
 
     stats = service.get_complaint_statistics()
 
@@ -282,50 +518,8 @@ def test_get_complaint_statistics(new_db, service: ComplaintService):
     assert stats["categories"]["misconduct"] == 2
     assert stats["categories"]["harassment"] == 1
     assert stats["categories"]["other"] == 0
-
-
-def test_search_complaints_by_category(new_db, service: ComplaintService):
-    """Test searching complaints by category"""
-    # Create complaints with different categories
-    misconduct_data = ComplaintCreate(
-        title="Misconduct complaint", description="Description", category=ComplaintCategory.MISCONDUCT
-    )
-    harassment_data = ComplaintCreate(
-        title="Harassment complaint", description="Description", category=ComplaintCategory.HARASSMENT
-    )
-
-    service.create_complaint(misconduct_data)
-    service.create_complaint(harassment_data)
-
-    # Search for misconduct complaints
-    misconduct_complaints = service.search_complaints(category=ComplaintCategory.MISCONDUCT)
-    assert len(misconduct_complaints) == 1
-    assert misconduct_complaints[0].title == "Misconduct complaint"
-
-    # Search for harassment complaints
-    harassment_complaints = service.search_complaints(category=ComplaintCategory.HARASSMENT)
-    assert len(harassment_complaints) == 1
-    assert harassment_complaints[0].title == "Harassment complaint"
-
-
-def test_search_complaints_by_tracking_id(new_db, service: ComplaintService):
-    """Test searching complaints by tracking ID partial match"""
-    complaint_data = ComplaintCreate(title="Searchable complaint", description="This complaint should be searchable")
-
-    complaint, tracking_id = service.create_complaint(complaint_data)
-
-    # Search with partial tracking ID
-    partial_id = tracking_id[:6]  # First 6 characters
-    results = service.search_complaints(tracking_id=partial_id)
-
-    assert len(results) == 1
-    assert results[0].tracking_id == tracking_id
-
-
-def test_search_complaints_no_results(new_db, service: ComplaintService):
-    """Test search with no matching results"""
-    results = service.search_complaints(category=ComplaintCategory.CORRUPTION)
-    assert len(results) == 0
+    assert stats["urgencies"]["medium"] == 3  # Default urgency
+    assert stats["urgencies"]["critical"] == 0
 
 
 def test_invalid_complaint_id_attachment(new_db, service: ComplaintService):
@@ -1,18 +1,35 @@
 import pytest
 from io import BytesIO
+from typing import Dict, List
 from nicegui.testing import User
 from nicegui import ui
 from fastapi.datastructures import Headers, UploadFile
 
 from app.database import reset_db
-from app.complaint_service import ComplaintService
+from app.complaint_service import ComplaintService, _invalidate_caches
+from app.models import ComplaintCreate, ComplaintCategory
+
+SERVICE = ComplaintService()
+
+# Upload request parts are read-only, so build them once; each test still needs its own BytesIO
+UPLOAD_CONTENT = b"test file content for upload testing"
+UPLOAD_HEADERS = Headers(raw=[(b"content-type", b"image/jpeg")])
 
 
 @pytest.fixture()
 def new_db():
     reset_db()
+    _invalidate_caches()  # Dashboard data cached by an earlier test would outlive its rows
     yield
     reset_db()
+    _invalidate_caches()
+
+
+@pytest.fixture()
+def staged_uploads():
+    """Remove files staged by the upload page, which the test client never disconnects to clean up"""
+    yield
+    SERVICE.discard_all_staged_uploads()
 
 
 async def test_homepage_loads(user: User) -> None:
@@ -54,25 +71,38 @@ async def test_admin_page_loads(user: User, new_db) -> None:
     await user.should_see("Total Complaints")
 
 
+def _element_buckets(user: User, *kinds: type[ui.element]) -> Dict[type[ui.element], List[ui.element]]:
+    """Elements of the current page grouped by the given kinds, from a single walk of the element tree"""
+    buckets: Dict[type[ui.element], List[ui.element]] = {kind: [] for kind in kinds}
+    for element in user.find(ui.element).elements:
+        for kind in kinds:
+            if isinstance(element, kind):
+                buckets[kind].append(element)
+    return buckets
+
+
+def _buttons_by_text(user: User) -> Dict[str, ui.button]:
+    """Buttons of the current page keyed by their label"""
+    return {button.text: button for button in user.find(ui.button).elements if isinstance(button, ui.button)}
+
+
 async def test_form_elements_present(user: User) -> None:
     """Test that all form elements are present"""
     await user.open("/submit")
 
+    buckets = _element_buckets(user, ui.input, ui.select, ui.textarea, ui.upload)
+
     # Test input elements exist
-    title_inputs = list(user.find(ui.input).elements)
-    assert len(title_inputs) >= 1  # At least title input
+    assert len(buckets[ui.input]) >= 1  # At least title input
 
     # Test select elements exist
-    selects = list(user.find(ui.select).elements)
-    assert len(selects) >= 2  # Category and urgency selects
+    assert len(buckets[ui.select]) >= 2  # Category and urgency selects
 
     # Test textarea exists
-    textareas = list(user.find(ui.textarea).elements)
-    assert len(textareas) >= 1  # Description textarea
+    assert len(buckets[ui.textarea]) >= 1  # Description textarea
 
     # Test upload element exists
-    uploads = list(user.find(ui.upload).elements)
-    assert len(uploads) >= 1  # File upload
+    assert len(buckets[ui.upload]) >= 1  # File upload
 
 
 async def test_complaint_submission_basic(user: User, new_db) -> None:
@@ -88,32 +118,23 @@ async def test_complaint_submission_basic(user: User, new_db) -> None:
         "This is a detailed description of the complaint that is long enough to meet the minimum requirements."
     )
 
-    # Find and click submit button
-    buttons = list(user.find(ui.button).elements)
-    submit_button = None
-    for button in buttons:
-        # Look for button with submit text
-        if hasattr(button, "text") and "Submit" in str(button.text):
-            submit_button = button
-            break
+    # Find submit button
+    submit_button = _buttons_by_text(user).get("Submit Complaint")
+    assert submit_button is not None
 
-    if submit_button:
-        # For testing, we'll check that the form structure exists
-        # Complex form submission testing is challenging in headless mode
-        await user.should_see("Submit Complaint")  # Form is present
+    # For testing, we'll check that the form structure exists
+    # Complex form submission testing is challenging in headless mode
+    await user.should_see("Submit Complaint")  # Form is present
 
 
 async def test_tracking_with_service(user: User, new_db) -> None:
     """Test complaint tracking using service"""
     # Create a complaint using the service
-    service = ComplaintService()
-    from app.models import ComplaintCreate
-
     complaint_data = ComplaintCreate(
         title="Service test complaint", description="This complaint was created by the service for testing"
     )
 
-    complaint, tracking_id = service.create_complaint(complaint_data)
+    complaint, tracking_id = SERVICE.create_complaint(complaint_data)
 
     # Now test tracking through UI
     await user.open("/track")
@@ -122,21 +143,16 @@ async def test_tracking_with_service(user: User, new_db) -> None:
     tracking_input = list(user.find(ui.input).elements)[0]
     tracking_input.set_value(tracking_id)
 
-    # Click search button
-    buttons = list(user.find(ui.button).elements)
-    search_button = None
-    for button in buttons:
-        if hasattr(button, "text") and "Search" in str(button.text):
-            search_button = button
-            break
+    # Find search button
+    search_button = _buttons_by_text(user).get("Search Complaint")
+    assert search_button is not None
 
-    if search_button:
-        # For testing, we'll verify the tracking input works
-        # Complex UI interaction testing is simplified for reliability
-        await user.should_see("Search Complaint")  # Button is present
+    # For testing, we'll verify the tracking input works
+    # Complex UI interaction testing is simplified for reliability
+    await user.should_see("Search Complaint")  # Button is present
 
 
-async def test_file_upload_element(user: User, new_db) -> None:
+async def test_file_upload_element(user: User, new_db, staged_uploads) -> None:
     """Test file upload element functionality"""
     await user.open("/submit")
 
@@ -147,11 +163,7 @@ async def test_file_upload_element(user: User, new_db) -> None:
     upload_element = upload_elements[0]
 
     # Create test file
-    test_file = UploadFile(
-        BytesIO(b"test file content for upload testing"),
-        filename="test.jpg",
-        headers=Headers(raw=[(b"content-type", b"image/jpeg")]),
-    )
+    test_file = UploadFile(BytesIO(UPLOAD_CONTENT), filename="test.jpg", headers=UPLOAD_HEADERS)
 
     # Simulate upload
     upload_element.handle_uploads([test_file])
@@ -194,17 +206,12 @@ async def test_form_validation_messages(user: User, new_db) -> None:
     await user.open("/submit")
 
     # Try to submit empty form
-    buttons = list(user.find(ui.button).elements)
-    submit_button = None
-    for button in buttons:
-        if hasattr(button, "text") and "Submit" in str(button.text):
-            submit_button = button
-            break
+    submit_button = _buttons_by_text(user).get("Submit Complaint")
+    assert submit_button is not None
 
-    if submit_button:
-        # For testing, we verify the form structure exists
-        # Validation testing is complex in headless mode
-        await user.should_see("Submit Complaint")  # Form is present
+    # For testing, we verify the form structure exists
+    # Validation testing is complex in headless mode
+    await user.should_see("Submit Complaint")  # Form is present
 
 
 async def test_success_page_direct(user: User, new_db) -> None:
@@ -219,16 +226,13 @@ async def test_success_page_direct(user: User, new_db) -> None:
 async def test_admin_dashboard_with_data(user: User, new_db) -> None:
     """Test admin dashboard shows data"""
     # Create test complaint
-    service = ComplaintService()
-    from app.models import ComplaintCreate, ComplaintCategory
-
     complaint_data = ComplaintCreate(
         title="Admin test complaint",
         description="Test complaint for admin dashboard",
         category=ComplaintCategory.MISCONDUCT,
     )
 
-    service.create_complaint(complaint_data)
+    SERVICE.create_complaint(complaint_data)
 
     # Load admin page
     await user.open("/admin")
@@ -238,13 +242,7 @@ async def test_admin_dashboard_with_data(user: User, new_db) -> None:
     await user.should_see("Total Complaints")
 
 
-async def test_ui_elements_structure(user: User) -> None:
-    """Test overall UI structure is correct"""
-    # Test main pages load without errors
-    pages_to_test = ["/", "/submit", "/track", "/admin", "/success"]
-
-    for page in pages_to_test:
-        await user.open(page)
-        # Each page should load without throwing errors
-        # Test simplified to avoid element counting issues
-        pass  # Page loaded successfully
+@pytest.mark.parametrize("page", ["/", "/submit", "/track", "/admin", "/success"])
+async def test_ui_elements_structure(user: User, page: str) -> None:
+    """Test each main page loads without errors"""
+    await user.open(page)